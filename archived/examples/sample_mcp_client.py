@@ -9,31 +9,37 @@ def test_tool(message: str) -> str:
     """A simple test tool."""
     return f"Test response: {message}"
 
-client = Client(server)
-
 # Option 2: For external MCP server, use subprocess approach
 # This would require a different client setup - let's stick with in-memory for now
 
 async def main():
+    client = Client(server)
+    # One session for every call below: the handshake (and, for stdio
+    # servers, the subprocess spawn) happens once, not per call_tool.
     async with client:
         # Basic server interaction
         await client.ping()
-        
+
         # List available operations
         tools = await client.list_tools()
         resources = await client.list_resources()
         prompts = await client.list_prompts()
-        
+
         for t in tools:
             print(f"tool: {t.name}, tool description: {t.description}")
             print(f"""inputs: {t.inputSchema}
                       outputs: {t.outputSchema}\n""")
-        
+
         #print(tools)
-        
-        # Execute operations
+
+        # Execute operations back to back on the same session
+        for i in range(10):
+            result = await client.call_tool("test_tool", {"message": f"call {i}"})
+            print(result.data)
+
         #result = await client.call_tool("open_session", {"url": "https://www.google.com"})
 
         #print(result)
 
-asyncio.run(main())
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,55 +1,239 @@
+import os
+
+# Tesseract's OpenMP pool costs more than it saves on single screenshots;
+# this must be set before Tesseract is loaded.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import pyautogui
 import pytesseract
 import cv2
 import numpy as np
+import hashlib
+import platform
+import shutil
 from PIL import Image
 import time
 
+try:  # optional: grabs raw pixels without a PIL round trip
+    import mss
+except ImportError:  # pragma: no cover - falls back to pyautogui
+    mss = None
+
+try:  # optional: keeps the Tesseract model loaded in-process
+    import tesserocr
+except ImportError:  # pragma: no cover - falls back to the pytesseract CLI
+    tesserocr = None
+
+try:  # optional: fuzzy matching for find_any_text_on_screen(min_score=...)
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - min_score then raises a clear error
+    fuzz = process = None
+
+OCR_CACHE_SIZE = 32
+SMALL_ROI_HEIGHT = 40
+# Rows whose intensity varies less than this hold no text
+FLAT_ROW_STD = 4.0
+ROW_PADDING = 4
+# Fewer Canny edge pixels than this cannot form even one glyph
+MIN_TEXT_EDGE_PIXELS = 20
+# Characters a tessedit_char_whitelist cannot carry through the CLI config
+UNSAFE_CHARSET_CHARS = "\"'\\"
+
+
+def _default_tesseract_cmd():
+    """Return the tesseract binary: $TESSERACT_CMD, then PATH, then the Windows default."""
+    cmd = os.environ.get("TESSERACT_CMD") or shutil.which("tesseract")
+    if cmd:
+        return cmd
+    if platform.system() == "Windows":
+        return 'C:\\Program Files\\Tesseract-OCR\\tesseract.exe'
+    return 'tesseract'
+
 
 class GUIAgent:
     def __init__(self, pytesseract_path=None):
-        if pytesseract_path:
-            pytesseract.pytesseract.tesseract_cmd = pytesseract_path
+        pytesseract.pytesseract.tesseract_cmd = pytesseract_path or _default_tesseract_cmd()
+        self._sct = None
+        self._ocr = None
+        # Word boxes for recently OCR'd frames, keyed by a hash of the pixels
+        self._ocr_cache = {}
+        # Grayscale templates for click_image_on_screen, keyed by path
+        self._templates = {}
+
+    def _grab(self, region=None):
+        """Return an RGB array of the screen (or a (left, top, width, height) region)."""
+        if mss is None:
+            return np.asarray(pyautogui.screenshot(region=region))
+        if self._sct is None:
+            self._sct = mss.mss()
+        if region:
+            left, top, width, height = region
+            monitor = {"left": left, "top": top, "width": width, "height": height}
         else:
-            # if it is windows, set default path
-            import platform
-            if platform.system() == "Windows":
-                pytesseract.pytesseract.tesseract_cmd = 'C:\\Program Files\\Tesseract-OCR\\tesseract.exe'  
-            else:
-                pytesseract.pytesseract.tesseract_cmd = 'tesseract'
+            monitor = self._sct.monitors[1]
+        raw = self._sct.grab(monitor)
+        return np.frombuffer(raw.rgb, dtype=np.uint8).reshape(raw.height, raw.width, 3)
+
+    def _ocr_words(self, image, charset=None):
+        """Yield (word, left, top, width, height) for each word Tesseract finds."""
+        if tesserocr is None:
+            # Use OCR (LSTM engine only) to extract text + bounding boxes
+            config = "--oem 1"
+            if charset:
+                config += f' -c "tessedit_char_whitelist={charset}"'
+            data = pytesseract.image_to_data(
+                image, config=config, output_type=pytesseract.Output.DICT
+            )
+            yield from zip(
+                data["text"], data["left"], data["top"], data["width"], data["height"]
+            )
+            return
+        if self._ocr is None:
+            self._ocr = tesserocr.PyTessBaseAPI(oem=tesserocr.OEM.LSTM_ONLY)
+        # An empty whitelist restores the full character set
+        self._ocr.SetVariable("tessedit_char_whitelist", charset or "")
+        self._ocr.SetImage(Image.fromarray(image))
+        self._ocr.Recognize()
+        level = tesserocr.RIL.WORD
+        for word in tesserocr.iterate_level(self._ocr.GetIterator(), level):
+            box = word.BoundingBox(level)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            yield word.GetUTF8Text(level) or "", x1, y1, x2 - x1, y2 - y1
     
-    def find_text_on_screen(self, text, region=None, confidence=0.8):
-        """Find text on the screen using OCR and click it."""
-        screenshot = pyautogui.screenshot(region=region)
+    def _cached_ocr_words(self, image, charset=None):
+        """Return OCR word boxes, reusing them while the screen is unchanged."""
+        key = (image.shape, charset, hashlib.md5(image).digest())
+        words = self._ocr_cache.get(key)
+        if words is None:
+            # Words are stored normalised so repeated polls skip strip/lower
+            words = [
+                (word.strip().lower(), x, y, w, h)
+                for word, x, y, w, h in self._ocr_words(image, charset)
+            ]
+            if len(self._ocr_cache) >= OCR_CACHE_SIZE:
+                self._ocr_cache.pop(next(iter(self._ocr_cache)))
+            self._ocr_cache[key] = words
+        return words
+
+    def find_text_on_screen(self, text, region=None, confidence=0.8, fuzzy=False, charset=None):
+        """Find text on the screen using OCR and click it.
+
+        With ``fuzzy=True``, a word whose similarity to ``text`` is at least
+        ``confidence`` also counts, which tolerates OCR misreads ("lnbox").
+        """
+        min_score = confidence * 100 if fuzzy else None
+        found = self.find_any_text_on_screen(
+            [text], region=region, min_score=min_score, charset=charset
+        )
+        return found is not None
+
+    def find_any_text_on_screen(self, texts, region=None, min_score=None, charset=None):
+        """Click the first OCR'd word matching any of ``texts``; return that text or None.
+
+        Exact matches win; if there are none and ``min_score`` (0-100) is given,
+        the closest word by rapidfuzz ratio at or above it is clicked instead.
+        ``charset`` limits the characters Tesseract may output (e.g.
+        ``string.ascii_letters``), which speeds up and sharpens recognition;
+        it may not contain whitespace, quotes or backslashes, which the
+        tesseract CLI config cannot carry (words never contain whitespace).
+        """
+        if charset and any(char.isspace() or char in UNSAFE_CHARSET_CHARS for char in charset):
+            raise ValueError("charset must not contain whitespace, quotes or backslashes.")
+        # One OCR pass and one set lookup per word, however many texts are given
+        targets = {text.lower(): text for text in texts}
+        screenshot = self._grab(region)
         
-        # Convert screenshot to OpenCV format
-        image = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2BGR) 
-
-        # Use OCR to extract text + bounding boxes
-        data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
-
-        # Iterate through detected text
-        for i, word in enumerate(data["text"]):
-            if word.strip().lower() == text.lower():
-                x, y, w, h = data["left"][i], data["top"][i], data["width"][i], data["height"][i]
-                print(f"Found '{text}' at ({x},{y})")
-                pyautogui.click(x + w // 2, y + h // 2)
-                return True
-        return False
+        # Binarise up front (Otsu) so Tesseract skips its own thresholding;
+        # dark themes are inverted so text is always dark on light
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_RGB2GRAY)
+        # Crop away flat (text-free) rows above and below the content
+        rows = np.flatnonzero(gray.std(axis=1) > FLAT_ROW_STD)
+        if rows.size == 0:
+            return None
+        top = max(int(rows[0]) - ROW_PADDING, 0)
+        gray = gray[top:int(rows[-1]) + ROW_PADDING + 1]
+        # A frame with almost no edges has no glyphs; skip OCR for it
+        if np.count_nonzero(cv2.Canny(gray, 50, 150)) < MIN_TEXT_EDGE_PIXELS:
+            return None
+        # Thin strips (one line of UI text) are below Tesseract's preferred glyph
+        # size; upscale them and map the boxes back afterwards
+        scale = 2 if gray.shape[0] < SMALL_ROI_HEIGHT else 1
+        if scale > 1:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+        mode = cv2.THRESH_BINARY_INV if gray.mean() < 128 else cv2.THRESH_BINARY
+        _, image = cv2.threshold(gray, 0, 255, mode + cv2.THRESH_OTSU)
 
+        # Boxes are relative to the captured region
+        offset_x, offset_y = (region[0], region[1]) if region else (0, 0)
+        offset_y += top
+        words = self._cached_ocr_words(image, charset)
+        match = next(
+            ((targets[entry[0]], entry) for entry in words if entry[0] in targets), None
+        )
+        if match is None and min_score is not None and words:
+            match = self._closest_word(targets, words, min_score)
+        if match is None:
+            return None
+        text, (_, x, y, w, h) = match
+        x, y, w, h = x // scale, y // scale, w // scale, h // scale
+        x, y = x + offset_x, y + offset_y
+        print(f"Found '{text}' at ({x},{y})")
+        pyautogui.click(x + w // 2, y + h // 2)
+        return text
 
-    def click_image_on_screen(self, image_path, confidence=0.8):
+    @staticmethod
+    def _closest_word(targets, words, min_score):
+        """Return (text, word entry) for the best fuzzy match at or above min_score."""
+        if process is None:
+            raise ImportError(
+                "min_score needs rapidfuzz; install it with `pip install botman[speedups]`."
+            )
+        choices = [entry[0] for entry in words]
+        best = None
+        for target, text in targets.items():
+            hit = process.extractOne(target, choices, scorer=fuzz.ratio, score_cutoff=min_score)
+            if hit is not None and (best is None or hit[1] > best[0]):
+                best = (hit[1], text, words[hit[2]])
+        return None if best is None else (best[1], best[2])
+
+
+    def _template(self, image_path):
+        """Load a template image as grayscale once and reuse it."""
+        template = self._templates.get(image_path)
+        if template is None:
+            template = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                raise FileNotFoundError(f"Could not read template image: {image_path}")
+            self._templates[image_path] = template
+        return template
+
+    def click_image_on_screen(self, image_path, confidence=0.8, region=None):
         """Find an image on the screen and click it."""
-        location = pyautogui.locateCenterOnScreen(image_path, confidence=confidence)
-        if location:
+        template = self._template(image_path)
+        gray = cv2.cvtColor(self._grab(region), cv2.COLOR_RGB2GRAY)
+        scores = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (x, y) = cv2.minMaxLoc(scores)
+        if score >= confidence:
+            h, w = template.shape
+            offset_x, offset_y = (region[0], region[1]) if region else (0, 0)
+            location = (x + offset_x + w // 2, y + offset_y + h // 2)
             print(f"Found image at {location}")
-            pyautogui.click(location)
+            pyautogui.click(*location)
             return True
         return False
     
     def type_text(self, text, interval=0.05):
         """Type text into the active window."""
         pyautogui.write(text, interval=interval)
+
+    def paste_text(self, text):
+        """Insert text with one clipboard paste instead of per-key typing (replaces the clipboard)."""
+        import pyperclip  # installed alongside pyautogui
+
+        pyperclip.copy(text)
+        pyautogui.hotkey("command" if platform.system() == "Darwin" else "ctrl", "v")
         
     def press_key(self, key):
         """Press a single key."""
@@ -65,8 +249,7 @@ class GUIAgent:
         
     def screenshot_region(self, region, save_path):
         """Take a screenshot of a specific region."""
-        screenshot = pyautogui.screenshot(region=region)
-        screenshot.save(save_path)
+        Image.fromarray(self._grab(region)).save(save_path)
         
     def scroll(self, clicks):
         """Scroll the mouse wheel."""
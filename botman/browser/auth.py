@@ -12,6 +12,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Mapping
 
+# Module __file__ paths are already absolute; skip the realpath walk of resolve().
+_MODULE_DIR = Path(__file__).parent
+
 # Args that minimise automation fingerprints when launching a headed browser.
 DEFAULT_STEALTH_ARGS: tuple[str, ...] = (
     "--disable-blink-features=AutomationControlled",
@@ -34,14 +37,22 @@ class DomainConfig:
     storage_state_path: Path
     launch_options: Mapping[str, object] = field(default_factory=dict)
     context_options: Mapping[str, object] = field(default_factory=dict)
+    # Cached sessions older than this are refreshed before use (None: never).
+    max_age_s: float | None = None
+    # How long the manual login flow waits for a logged-in page.
+    login_timeout_s: float = 300.0
+    # Regex (``re.search``) matching URLs only reached once logged in.  When
+    # unset, any page on ``domain`` other than ``login_url`` counts.
+    success_url_pattern: str | None = None
+    # Selector that only appears for a logged-in user, checked after the URL.
+    success_selector: str | None = None
 
 
 def default_domain_configs(base_dir: Path | None = None) -> Dict[str, DomainConfig]:
     """Return the default domain configuration set (currently Gmail only)."""
 
-    root = base_dir or Path(__file__).resolve().parent
+    root = base_dir or _MODULE_DIR
     storage_dir = root / "storage"
-    storage_dir.mkdir(parents=True, exist_ok=True)
 
     gmail_storage = storage_dir / "mail.google.com.json"
 
@@ -50,10 +61,10 @@ def default_domain_configs(base_dir: Path | None = None) -> Dict[str, DomainConf
         login_url="https://accounts.google.com/ServiceLogin?service=mail",
         instructions=(
             "A headed Chrome window will open. Sign in to Gmail manually (including "
-            "any MFA). Once your inbox loads, return to the terminal and press Enter "
-            "to cache the session."
+            "any MFA). The session is cached automatically once your inbox loads."
         ),
         storage_state_path=gmail_storage,
+        max_age_s=24 * 60 * 60,
         launch_options={
             "headless": False,
             "channel": "chrome",
@@ -10,39 +10,220 @@ being reliable for the MCP tooling.
 
 from __future__ import annotations
 
-import base64
+import json
 import logging
+import re
+import sys
+import threading
+import time
+import weakref
 from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from inspect import signature
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from urllib.parse import urlparse
 
 from playwright.sync_api import (
     Browser,
     BrowserContext,
+    CDPSession,
+    ElementHandle,
     Error,
+    Frame,
     Page,
     Playwright,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
     sync_playwright,
 )
 
 from .auth import DomainConfig, default_domain_configs
 
-ALLOWED_WAIT_STATES = {"load", "domcontentloaded", "networkidle"}
-ALLOWED_SELECTOR_STATES = {"attached", "detached", "visible", "hidden"}
+try:  # Optional SIMD-accelerated codec (``pip install botman[speedups]``).
+    import pybase64 as base64
+
+    _b64encode_str = base64.b64encode_as_string
+except ImportError:  # pragma: no cover - depends on the environment
+    import base64
+
+    def _b64encode_str(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
+ALLOWED_WAIT_STATES = frozenset({"load", "domcontentloaded", "networkidle"})
+ALLOWED_SELECTOR_STATES = frozenset({"attached", "detached", "visible", "hidden"})
+_WAIT_STATE_ERROR = "wait_until must be one of {%s}." % ", ".join(sorted(ALLOWED_WAIT_STATES))
+_SELECTOR_STATE_ERROR = "state must be one of {%s}." % ", ".join(sorted(ALLOWED_SELECTOR_STATES))
+DEFAULT_CONTEXT_POOL_SIZE = 8
+DEFAULT_CONTEXT_IDLE_TIMEOUT_S = 120.0
+DEFAULT_PREWARM_CONTEXTS = 1
+DEFAULT_MAX_CONCURRENCY = 4
+MAX_CONCURRENCY = 8
+MAX_BATCH_URLS = 32
+MAX_BATCH_STEPS = 32
+DEFAULT_JPEG_QUALITY = 70
+# Formats Playwright's own screenshot API understands; others go through CDP.
+_PLAYWRIGHT_IMAGE_FORMATS = frozenset({"png", "jpeg"})
 
 FieldInstruction = Dict[str, Any]
+# Keys accepted for a field's fill strategy, in order of precedence.
+_STRATEGY_ALIASES = ("strategy", "mode", "action")
+# Resource types callers may skip; "document" is excluded since blocking it
+# would abort the navigation itself.
+_SKIPPABLE_RESOURCE_TYPES = frozenset(
+    {
+        "stylesheet",
+        "image",
+        "media",
+        "font",
+        "script",
+        "texttrack",
+        "xhr",
+        "fetch",
+        "eventsource",
+        "websocket",
+        "manifest",
+        "other",
+    }
+)
+# Helpers ``run_batch`` may dispatch to.
+BATCHABLE_OPERATIONS = frozenset(
+    {
+        "navigate",
+        "list_links",
+        "extract_text",
+        "extract_html",
+        "click",
+        "fill_fields",
+        "submit_form",
+        "wait_for_selector",
+        "wait",
+        "describe_dom",
+        "list_forms",
+        "list_buttons",
+        "list_tables",
+        "evaluate_js",
+        "screenshot",
+        "inspect",
+    }
+)
+_FIELD_STRATEGIES = frozenset({"fill", "type", "check", "uncheck", "select"})
+
+_COLLECT_LINKS_JS = """({ rootSelector, selector, limit, offset }) => {
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    if (!root) {
+        return { rows: "", count: 0, total: 0 };
+    }
+    const separators = /[\\x00\\x1e\\x1f]/g;
+    const field = (value) => (value === null ? "\\x00" : value.replace(separators, " "));
+    // The default selector uses the engine's cached tag collection instead of
+    // a fresh selector match; it yields the same anchors in document order.
+    const elements = !selector || selector === "a"
+        ? root.getElementsByTagName("a")
+        : root.querySelectorAll(selector);
+    const total = elements.length;
+    const start = Math.min(offset || 0, total);
+    const count = limit === null || limit === undefined
+        ? total - start
+        : Math.min(limit, total - start);
+    const rows = new Array(count);
+    for (let index = 0; index < count; index++) {
+        const element = elements[start + index];
+        rows[index] = [
+            field(element.getAttribute("href") ?? ""),
+            field((element.innerText ?? "").trim()),
+            field(element.getAttribute("title")),
+            field(element.getAttribute("aria-label")),
+            field(element.getAttribute("target")),
+            field(element.getAttribute("rel")),
+        ].join("\\x1f");
+    }
+    return { rows: rows.join("\\x1e"), count, total };
+}"""
+# Rows come back as one string (fields split by \x1f, rows by \x1e, null as
+# \x00) so CDP serialises a single value instead of an object per link.
+_LINK_FIELDS = ("href", "text", "title", "aria_label", "target", "rel")
+_REQUEST_SUBMIT_JS = """element => {
+    if (element.requestSubmit) {
+        element.requestSubmit();
+    } else {
+        element.submit();
+    }
+}"""
+# Reads every plain-CSS selector in one round-trip; ``null`` marks selectors
+# that need Playwright's own engine (text=, :has-text(), shadow DOM) or that
+# have not rendered yet, which the caller reads through a waiting locator.
+_INNER_TEXTS_JS = """selectors => selectors.map((selector) => {
+    try {
+        const element = document.querySelector(selector);
+        return element && typeof element.innerText === 'string' ? element.innerText : null;
+    } catch (error) {
+        return null;
+    }
+})"""
+# Installed into every context we create so ``_collect_links`` only ships a
+# one-line call per invocation instead of re-sending and re-parsing the body.
+_PAGE_HELPERS_INIT = f"window.__botmanCollectLinks = {_COLLECT_LINKS_JS};"
+_COLLECT_LINKS_CALL = (
+    "(args) => typeof window.__botmanCollectLinks === 'function'"
+    " ? window.__botmanCollectLinks(args) : null"
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PooledContext:
+    """Idle browser context (and its page) kept warm between stateless calls."""
+
+    key: Optional[str]
+    context: BrowserContext
+    page: Page
+    idle_since: float = 0.0
+
+
 class BrowserBot(AbstractContextManager["BrowserBot"]):
     """Thin wrapper around Playwright for one-off page interactions.
 
-    By default each helper opens a fresh Chromium context, performs
-    the requested operation, and closes the context again.  Set
-    ``persist_context=True`` to reuse a single browser context/page
-    across calls for session continuity (cookies, navigation history).
+    By default each helper runs in its own Chromium context rather than
+    a shared page.  Set ``persist_context=True`` to reuse a single browser
+    context/page across calls for session continuity (cookies, navigation
+    history).
+
+    Stateless calls check contexts out of a small LRU pool (keyed by the
+    storage state they were created with) instead of paying the full
+    context setup cost every time; ``context_pool_size`` bounds how many
+    idle contexts are kept around and ``context_idle_timeout_s`` how long
+    they may sit unused before being closed.  ``startup()`` pre-creates
+    ``prewarm_contexts`` anonymous contexts so the first calls skip setup.
+    A reused anonymous context has its cookies and permissions cleared,
+    but localStorage, sessionStorage, IndexedDB and service workers from
+    earlier calls survive; pass ``context_pool_size=0`` when every call
+    needs a brand-new context.
+
+    Pass ``user_data_dir`` to run every call in one persistent Chromium
+    profile instead: cookies and local storage live in that directory, so
+    authenticated workflows survive restarts without storage-state files.
+    It implies ``persist_context=True``.
+
+    ``storage_state`` names a Playwright storage-state file used for hosts
+    without a domain config; ``save_storage_state`` snapshots the
+    persistent context back into it so stateless calls stay logged in.
+
+    Bots started on the same thread with the same ``headless`` and
+    ``launch_args`` share one Chromium process (each keeps its own
+    contexts); pass ``shared_browser=False`` for an isolated browser.
     """
 
     def __init__(
@@ -53,26 +234,56 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         default_timeout_ms: int = 5000,
         persist_context: bool = False,
         domain_configs: Optional[Mapping[str, DomainConfig]] = None,
+        context_pool_size: int = DEFAULT_CONTEXT_POOL_SIZE,
+        context_idle_timeout_s: float = DEFAULT_CONTEXT_IDLE_TIMEOUT_S,
+        prewarm_contexts: int = DEFAULT_PREWARM_CONTEXTS,
+        user_data_dir: Optional[str | Path] = None,
+        storage_state: Optional[str | Path] = None,
+        shared_browser: bool = True,
     ) -> None:
+        if context_pool_size < 0:
+            raise ValueError("context_pool_size must be non-negative.")
+        if prewarm_contexts < 0:
+            raise ValueError("prewarm_contexts must be non-negative.")
         self._headless = headless
-        self._launch_args = tuple(launch_args or ())
+        self._launch_args: List[str] = list(launch_args or ())
         self._default_timeout_ms = default_timeout_ms
-        self._persist_context = persist_context
+        self._user_data_dir = Path(user_data_dir).expanduser() if user_data_dir else None
+        self._default_storage_state = Path(storage_state).expanduser() if storage_state else None
+        self._shared_browser = shared_browser
+        self._persist_context = persist_context or self._user_data_dir is not None
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
+        self._context_pool_size = context_pool_size
+        self._context_idle_timeout_s = context_idle_timeout_s
+        self._prewarm_contexts = min(prewarm_contexts, context_pool_size)
+        self._context_pool: List[_PooledContext] = []
         self._domain_configs: Dict[str, DomainConfig] = dict(
             domain_configs or default_domain_configs()
         )
-        for cfg in self._domain_configs.values():
-            cfg.storage_state_path.parent.mkdir(parents=True, exist_ok=True)
         self._storage_state_cache: Dict[str, Path] = {
             domain: cfg.storage_state_path
             for domain, cfg in self._domain_configs.items()
             if cfg.storage_state_path.exists()
         }
+        self._host_config_domains: Dict[str, Tuple[str, ...]] = {}
+        self._storage_state_payloads: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
         self._current_storage_state_key: Optional[str] = None
+        self._cached_title: Optional[str] = None
+        self._cdp_sessions: "weakref.WeakKeyDictionary[Page, CDPSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._field_handlers: Dict[
+            str, Callable[[Page, FieldInstruction, int], object]
+        ] = {
+            "check": self._apply_check,
+            "uncheck": self._apply_uncheck,
+            "select": self._apply_select,
+            "type": self._apply_type,
+            "fill": self._apply_fill,
+        }
 
     # ------------------------------------------------------------------ #
     # Lifecycle helpers
@@ -89,21 +300,35 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         """Ensure a Chromium instance is available."""
         if self._playwright is not None:
             return
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch(
-            headless=self._headless,
-            args=list(self._launch_args),
-        )
+        self._playwright = _acquire_playwright()
+        if self._user_data_dir is not None:
+            self._launch_user_data_context()
+            return
+        if self._shared_browser:
+            self._browser = _acquire_browser(
+                self._playwright, headless=self._headless, args=self._launch_args
+            )
+        else:
+            self._browser = self._playwright.chromium.launch(
+                headless=self._headless,
+                args=self._launch_args,
+            )
+        if not self._persist_context:
+            self._prewarm_context_pool()
 
     def shutdown(self) -> None:
         """Close Chromium and release Playwright resources."""
         self._close_persistent_context()
+        self._drain_context_pool()
         self._current_storage_state_key = None
         if self._browser is not None:
-            self._browser.close()
+            if self._shared_browser:
+                _release_browser(self._browser)
+            else:
+                self._browser.close()
             self._browser = None
         if self._playwright is not None:
-            self._playwright.stop()
+            _release_playwright(self._playwright)
             self._playwright = None
 
     # ------------------------------------------------------------------ #
@@ -111,7 +336,14 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
     # ------------------------------------------------------------------ #
 
     def ensure_login(self, domain: str, *, force: bool = False) -> Dict[str, Any]:
-        """Ensure a cached Playwright storage state exists for ``domain``."""
+        """Ensure a cached Playwright storage state exists for ``domain``.
+
+        Fresh cached sessions are reused as-is.  Sessions older than the
+        domain's ``max_age_s`` are first refreshed headlessly; the manual
+        login flow only runs when that fails or nothing is cached.  With
+        ``user_data_dir`` the login happens in the profile itself, which
+        needs ``headless=False``.
+        """
 
         config = self._domain_configs.get(domain)
         if config is None:
@@ -119,32 +351,80 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
 
         storage_path = config.storage_state_path
         if not force and storage_path.exists():
-            self._storage_state_cache[domain] = storage_path
-            return {
-                "domain": domain,
-                "storage_state": str(storage_path),
-                "created": False,
-            }
+            refreshed = False
+            if not self._session_is_fresh(config):
+                refreshed = self._refresh_storage_state(config)
+            if refreshed or self._session_is_fresh(config):
+                self._storage_state_cache[domain] = storage_path
+                if refreshed:
+                    self._invalidate_persistent_context()
+                return {
+                    "domain": domain,
+                    "storage_state": str(storage_path),
+                    "created": False,
+                    "refreshed": refreshed,
+                }
 
-        self._run_manual_login(config)
+        if self._user_data_dir is not None:
+            self._run_profile_login(config)
+        else:
+            self._run_manual_login(config)
         if storage_path.exists():
             self._storage_state_cache[domain] = storage_path
-            self._invalidate_persistent_context()
+            if self._user_data_dir is None:
+                self._invalidate_persistent_context()
             return {
                 "domain": domain,
                 "storage_state": str(storage_path),
                 "created": True,
+                "refreshed": False,
             }
 
         raise RuntimeError(
             f"Manual login for {domain!r} did not populate {storage_path}."
         )
 
-    def navigate(self, url: str, *, wait_until: str = "load") -> Dict[str, str]:
-        """Navigate to ``url`` and return the final URL and page title."""
-        self._log_call("navigate", url=url, wait_until=wait_until)
+    def save_storage_state(self, path: Optional[str | Path] = None) -> Dict[str, str]:
+        """Write the persistent context's cookies and storage to ``path``.
+
+        Defaults to the ``storage_state`` file given at construction, so
+        later stateless calls start from the saved session.
+        """
+        target = Path(path).expanduser() if path else self._default_storage_state
+        if target is None:
+            raise ValueError("path is required when no storage_state was configured.")
+        if self._context is None:
+            raise RuntimeError("save_storage_state requires an open persistent context.")
+        self._log_call("save_storage_state", path=str(target))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._context.storage_state(path=target)
+        # Pooled contexts built from the previous snapshot are now stale.
+        key = str(target)
+        stale = [entry for entry in self._context_pool if entry.key == key]
+        self._context_pool = [entry for entry in self._context_pool if entry.key != key]
+        for entry in stale:
+            self._discard_context(entry)
+        result = {"storage_state": key}
+        self._log_result("save_storage_state", result)
+        return result
+
+    def navigate(
+        self,
+        url: str,
+        *,
+        wait_until: str = "load",
+        include_title: bool = True,
+    ) -> Dict[str, str]:
+        """Navigate to ``url`` and return the final URL and page title.
+
+        Pass ``include_title=False`` to skip the extra ``page.title()``
+        round-trip when only the final URL is needed.
+        """
+        self._log_call(
+            "navigate", url=url, wait_until=wait_until, include_title=include_title
+        )
         with self._open_page(url, wait_until=wait_until) as page:
-            result = {"final_url": page.url, "title": page.title()}
+            result = self._page_summary(page, include_title=include_title)
             self._log_result("navigate", result)
             return result
 
@@ -152,16 +432,25 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         self,
         url: Optional[str] = None,
         *,
-        wait_until: str = "load",
+        wait_until: str = "domcontentloaded",
         limit: Optional[int] = 200,
         root_selector: Optional[str] = None,
         link_selector: Optional[str] = None,
+        skip_resources: Optional[Sequence[str]] = None,
+        offset: int = 0,
     ) -> Dict[str, object]:
         """Return metadata about anchor tags discovered on ``url``.
 
         When ``persist_context`` is enabled, ``url`` may be ``None`` to
-        operate on the currently loaded page.
+        operate on the currently loaded page.  ``skip_resources`` (e.g.
+        ``["image", "media", "font", "stylesheet"]``) aborts those requests
+        while the page loads.  Page through large link sets with
+        ``offset``/``limit``; ``limit=0`` returns just the total ``count``.
         """
+        if offset < 0:
+            raise ValueError("offset must be non-negative.")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative.")
         self._log_call(
             "list_links",
             url=url,
@@ -169,17 +458,21 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             limit=limit,
             root_selector=root_selector,
             link_selector=link_selector,
+            skip_resources=skip_resources,
+            offset=offset or None,
         )
-        with self._open_page(url, wait_until=wait_until) as page:
+        with self._open_page(
+            url, wait_until=wait_until, skip_resources=skip_resources
+        ) as page:
             links, truncated, total = self._collect_links(
                 page,
                 limit=limit,
                 root_selector=root_selector,
                 link_selector=link_selector,
+                offset=offset,
             )
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "links": links,
                 "count": total,
                 "truncated": truncated,
@@ -187,18 +480,104 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             self._log_result("list_links", result)
             return result
 
+    def navigate_many(
+        self,
+        urls: Sequence[str],
+        *,
+        wait_until: str = "load",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Dict[str, object]:
+        """Load several URLs with overlapping page loads.
+
+        Results keep the input order; a URL that fails carries an
+        ``error``/``message`` pair instead of aborting the batch.  At most
+        ``MAX_BATCH_URLS`` URLs and ``MAX_CONCURRENCY`` open pages are
+        allowed.  The pages come from the stateless context pool, so with
+        ``persist_context`` they do not see the persistent page's cookies;
+        with ``user_data_dir`` they open as temporary tabs in the profile.
+        """
+        self._log_call(
+            "navigate_many",
+            urls_count=len(urls),
+            wait_until=wait_until,
+            max_concurrency=max_concurrency,
+        )
+        results = self._visit_many(
+            urls,
+            wait_until=wait_until,
+            max_concurrency=max_concurrency,
+            handler=self._page_summary,
+        )
+        result = {"results": results, "count": len(results)}
+        self._log_result("navigate_many", result)
+        return result
+
+    def list_links_many(
+        self,
+        urls: Sequence[str],
+        *,
+        wait_until: str = "domcontentloaded",
+        limit: Optional[int] = 200,
+        root_selector: Optional[str] = None,
+        link_selector: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Dict[str, object]:
+        """Run ``list_links`` over several URLs with overlapping page loads.
+
+        Limits and session handling match ``navigate_many``.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("limit must be non-negative.")
+        self._log_call(
+            "list_links_many",
+            urls_count=len(urls),
+            wait_until=wait_until,
+            limit=limit,
+            root_selector=root_selector,
+            link_selector=link_selector,
+            max_concurrency=max_concurrency,
+        )
+
+        def handler(page: Page) -> Dict[str, object]:
+            links, truncated, total = self._collect_links(
+                page,
+                limit=limit,
+                root_selector=root_selector,
+                link_selector=link_selector,
+            )
+            return {
+                **self._page_summary(page),
+                "links": links,
+                "count": total,
+                "truncated": truncated,
+            }
+
+        results = self._visit_many(
+            urls,
+            wait_until=wait_until,
+            max_concurrency=max_concurrency,
+            handler=handler,
+        )
+        result = {"results": results, "count": len(results)}
+        self._log_result("list_links_many", result)
+        return result
+
     def extract_text(
         self,
         url: Optional[str] = None,
         *,
         selector: str,
-        wait_until: str = "load",
+        wait_until: str = "domcontentloaded",
         timeout_ms: Optional[int] = None,
+        early: bool = False,
+        skip_resources: Optional[Sequence[str]] = None,
     ) -> Dict[str, str]:
         """Return the text content for ``selector`` on ``url``.
 
         With ``persist_context`` enabled, ``url`` may be ``None`` to
-        reuse the current page.
+        reuse the current page.  Pass ``early=True`` to read as soon as
+        ``selector`` is attached instead of waiting for ``wait_until``;
+        ``skip_resources`` aborts requests of those resource types.
         """
         if not selector:
             raise ValueError("selector must be a non-empty string.")
@@ -208,14 +587,24 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             selector=selector,
             wait_until=wait_until,
             timeout_ms=timeout_ms,
+            early=early,
+            skip_resources=skip_resources,
         )
         effective_timeout = timeout_ms or self._default_timeout_ms
-        with self._open_page(url, wait_until=wait_until) as page:
-            element = page.wait_for_selector(selector, timeout=effective_timeout)
-            text = element.inner_text() if element else ""
+        with self._open_page(
+            url,
+            wait_until=wait_until,
+            early_selector=selector if early else None,
+            timeout_ms=effective_timeout,
+            skip_resources=skip_resources,
+        ) as page:
+            # Wait for visibility as before; hidden matches must time out
+            # rather than yield their (often empty) text.
+            locator = page.locator(selector).first
+            locator.wait_for(state="visible", timeout=effective_timeout)
+            text = locator.inner_text(timeout=effective_timeout)
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "selector": selector,
                 "text": text.strip(),
             }
@@ -226,15 +615,17 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         self,
         url: Optional[str] = None,
         *,
-        wait_until: str = "load",
+        wait_until: str = "domcontentloaded",
         selector: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         inner: bool = False,
+        skip_resources: Optional[Sequence[str]] = None,
     ) -> Dict[str, str]:
         """Return the HTML for ``selector`` (or the full page when omitted).
 
         With ``persist_context`` enabled, ``url`` may be ``None`` to
-        reuse the current page.
+        reuse the current page.  ``skip_resources`` aborts requests of
+        those resource types while the page loads.
         """
         self._log_call(
             "extract_html",
@@ -243,22 +634,27 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             selector=selector,
             timeout_ms=timeout_ms,
             inner=inner,
+            skip_resources=skip_resources,
         )
         effective_timeout = timeout_ms or self._default_timeout_ms
-        with self._open_page(url, wait_until=wait_until) as page:
+        with self._open_page(
+            url, wait_until=wait_until, skip_resources=skip_resources
+        ) as page:
             if selector:
-                element = page.wait_for_selector(selector, timeout=effective_timeout)
-                if not element:
-                    html = ""
-                elif inner:
-                    html = element.inner_html()
+                # inner_html/evaluate only wait for attachment; keep the
+                # visibility guarantee the element-handle path had.
+                locator = page.locator(selector).first
+                locator.wait_for(state="visible", timeout=effective_timeout)
+                if inner:
+                    html = locator.inner_html(timeout=effective_timeout)
                 else:
-                    html = element.evaluate("node => node.outerHTML")
+                    html = locator.evaluate(
+                        "node => node.outerHTML", timeout=effective_timeout
+                    )
             else:
                 html = page.content()
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "selector": selector,
                 "inner": inner,
                 "html": html,
@@ -271,14 +667,18 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         url: Optional[str] = None,
         *,
         selector: str,
-        wait_until: str = "load",
+        wait_until: str = "domcontentloaded",
         timeout_ms: Optional[int] = None,
-        post_wait: Optional[str] = "networkidle",
+        post_wait: Optional[str] = "domcontentloaded",
+        include_title: bool = True,
+        early: bool = False,
     ) -> Dict[str, str]:
         """Click ``selector`` on ``url`` and return the resulting page info.
 
         With ``persist_context`` enabled, ``url`` may be ``None`` to
-        reuse the current page.
+        reuse the current page.  Pass ``include_title=False`` to omit the
+        page title from the result, and ``early=True`` to click as soon as
+        ``selector`` is attached instead of waiting for ``wait_until``.
         """
         if not selector:
             raise ValueError("selector must be a non-empty string.")
@@ -289,16 +689,21 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             wait_until=wait_until,
             timeout_ms=timeout_ms,
             post_wait=post_wait,
+            include_title=include_title,
+            early=early,
         )
         effective_timeout = timeout_ms or self._default_timeout_ms
-        with self._open_page(url, wait_until=wait_until) as page:
-            page.wait_for_selector(selector, timeout=effective_timeout)
-            page.click(selector, timeout=effective_timeout)
+        with self._open_page(
+            url,
+            wait_until=wait_until,
+            early_selector=selector if early else None,
+            timeout_ms=effective_timeout,
+        ) as page:
+            page.locator(selector).first.click(timeout=effective_timeout)
             if post_wait:
                 page.wait_for_load_state(post_wait)
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page, include_title=include_title, fresh=True),
                 "clicked": selector,
             }
             self._log_result("click", result)
@@ -312,11 +717,17 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         wait_until: str = "load",
         timeout_ms: Optional[int] = None,
         clear_existing: bool = True,
+        batch: bool = False,
     ) -> Dict[str, object]:
         """Populate form controls identified by ``fields`` on ``url``.
 
         With ``persist_context`` enabled, ``url`` may be ``None`` to
-        reuse the current page.
+        reuse the current page.  ``batch=True`` sets plain text fields and
+        checkboxes in one ``page.evaluate`` (firing ``input``/``change``
+        events) and only falls back to the per-field Playwright calls for
+        the fields it cannot resolve.
+        The ``type`` strategy inserts text in a single input event unless a
+        positive ``delay`` asks for real per-key typing.
         """
         instructions = self._normalize_fields(fields)
         self._log_call(
@@ -325,6 +736,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             wait_until=wait_until,
             timeout_ms=timeout_ms,
             clear_existing=clear_existing,
+            batch=batch,
             fields_count=len(instructions),
         )
         effective_timeout = timeout_ms or self._default_timeout_ms
@@ -334,10 +746,10 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
                 instructions,
                 timeout=effective_timeout,
                 clear=clear_existing,
+                batch=batch,
             )
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page, fresh=True),
                 "filled": filled,
                 "count": len(filled),
             }
@@ -391,32 +803,25 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
                     clear=clear_existing,
                 )
             if submit_selector:
-                page.wait_for_selector(submit_selector, timeout=effective_timeout)
-                page.click(submit_selector, timeout=effective_timeout)
+                page.locator(submit_selector).first.click(timeout=effective_timeout)
                 submitted = submit_selector
             else:
-                form = page.wait_for_selector(form_selector, timeout=effective_timeout)
-                if not form:
-                    raise RuntimeError(f"form {form_selector!r} not found.")
-                form.evaluate(
-                    """element => {
-                        if (element.requestSubmit) {
-                            element.requestSubmit();
-                        } else {
-                            element.submit();
-                        }
-                    }"""
-                )
+                form = page.locator(form_selector).first
+                form.wait_for(state="visible", timeout=effective_timeout)
+                form.evaluate(_REQUEST_SUBMIT_JS, timeout=effective_timeout)
                 submitted = form_selector
             if post_wait:
                 page.wait_for_load_state(post_wait)
             waited_state: Optional[str] = None
             if wait_for:
-                page.wait_for_selector(wait_for, timeout=effective_timeout, state=wait_state)
+                # A locator wait returns no handle, so there is nothing to
+                # dispose afterwards.
+                page.locator(wait_for).first.wait_for(
+                    state=wait_state, timeout=effective_timeout
+                )
                 waited_state = wait_state
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page, fresh=True),
                 "submitted": submitted,
                 "filled": filled,
                 "waited_for": wait_for,
@@ -457,9 +862,9 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
                 timeout=effective_timeout,
                 state=wait_state,
             )
+            self._dispose(element)
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "selector": selector,
                 "state": wait_state,
                 "element_found": element is not None,
@@ -485,8 +890,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         with self._open_page(url, wait_until=wait_until) as page:
             page.wait_for_timeout(delay_ms)
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page, fresh=True),
                 "delay_ms": delay_ms,
             }
             self._log_result("wait", result)
@@ -501,15 +905,24 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         full_page: bool = True,
         image_format: str = "png",
         quality: Optional[int] = None,
+        encode: str = "base64",
+        output_path: Optional[str | Path] = None,
     ) -> Dict[str, object]:
         """Capture a screenshot of ``url`` and return it as a base64 string.
 
         With ``persist_context`` enabled, ``url`` may be ``None`` to
-        reuse the current page.
+        reuse the current page.  JPEG and WebP captures default to
+        ``DEFAULT_JPEG_QUALITY`` when ``quality`` is omitted; WebP is
+        captured through Chromium's DevTools protocol.  Python
+        callers that want the image bytes can pass ``encode="raw"`` to get
+        them under ``"screenshot"`` and skip base64 encoding entirely;
+        ``encode="data_uri"`` returns a ready-to-embed
+        ``"screenshot_data_uri"`` instead of ``"screenshot_base64"``.
+        With ``output_path`` the image is written to disk and only
+        ``"screenshot_path"`` is returned, keeping large captures out of
+        the result payload.
         """
-        valid_formats = {"png", "jpeg"}
-        if image_format not in valid_formats:
-            raise ValueError(f"image_format must be one of {valid_formats}.")
+        quality = self._validate_screenshot_options(image_format, quality, encode)
         self._log_call(
             "screenshot",
             url=url,
@@ -518,33 +931,162 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             full_page=full_page,
             image_format=image_format,
             quality=quality,
+            encode=encode,
+            output_path=output_path,
         )
         with self._open_page(url, wait_until=wait_until) as page:
-            if selector:
-                element = page.wait_for_selector(selector, timeout=self._default_timeout_ms)
-                data = element.screenshot(type=image_format, quality=quality)
-            else:
-                data = page.screenshot(full_page=full_page, type=image_format, quality=quality)
-            if isinstance(data, bytes):
-                encoded = base64.b64encode(data).decode("ascii")
-            else:
-                encoded = data
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "image_format": image_format,
-                "screenshot_base64": encoded,
                 "full_page": full_page,
                 "selector": selector,
+                **self._capture_screenshot(
+                    page,
+                    selector=selector,
+                    full_page=full_page,
+                    image_format=image_format,
+                    quality=quality,
+                    encode=encode,
+                    output_path=output_path,
+                ),
             }
             self._log_result("screenshot", result)
             return result
 
-    def describe_dom(
+    def inspect(
         self,
         url: Optional[str] = None,
         *,
         wait_until: str = "load",
+        text_selectors: Optional[Sequence[str]] = None,
+        links: bool = False,
+        link_limit: Optional[int] = 200,
+        screenshot: bool = False,
+        full_page: bool = True,
+        image_format: str = "png",
+        quality: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+    ) -> Dict[str, object]:
+        """Run several read-only operations against one load of ``url``.
+
+        Combines ``extract_text`` (one entry per selector in
+        ``text_selectors``), ``list_links`` and ``screenshot`` so callers pay
+        for a single context checkout and navigation.  Only the requested
+        sections appear in the result.
+        """
+        selectors = list(text_selectors or [])
+        if not all(selectors):
+            raise ValueError("text_selectors must contain non-empty strings.")
+        if link_limit is not None and link_limit < 0:
+            raise ValueError("link_limit must be non-negative.")
+        if screenshot:
+            quality = self._validate_screenshot_options(image_format, quality, "base64")
+        self._log_call(
+            "inspect",
+            url=url,
+            wait_until=wait_until,
+            text_selectors=selectors or None,
+            links=links,
+            link_limit=link_limit,
+            screenshot=screenshot,
+            timeout_ms=timeout_ms,
+        )
+        effective_timeout = timeout_ms or self._default_timeout_ms
+        with self._open_page(url, wait_until=wait_until) as page:
+            result: Dict[str, object] = dict(self._page_summary(page))
+            if selectors:
+                texts = page.evaluate(_INNER_TEXTS_JS, selectors)
+                result["text"] = {
+                    selector: (
+                        text
+                        if text is not None
+                        else page.locator(selector).first.inner_text(
+                            timeout=effective_timeout
+                        )
+                    ).strip()
+                    for selector, text in zip(selectors, texts)
+                }
+            if links:
+                collected, truncated, total = self._collect_links(
+                    page, limit=link_limit, root_selector=None, link_selector=None
+                )
+                result.update(links=collected, count=total, truncated=truncated)
+            if screenshot:
+                result["image_format"] = image_format
+                result.update(
+                    self._capture_screenshot(
+                        page,
+                        selector=None,
+                        full_page=full_page,
+                        image_format=image_format,
+                        quality=quality,
+                        encode="base64",
+                    )
+                )
+            self._log_result("inspect", result)
+            return result
+
+    def run_batch(self, steps: Sequence[Mapping[str, Any]]) -> Dict[str, object]:
+        """Run several helper calls back to back on this bot.
+
+        Each step is ``{"op": "<method>", "args": {...}}`` naming one of the
+        public helpers in ``BATCHABLE_OPERATIONS``, up to ``MAX_BATCH_STEPS``
+        per call.  Every step's arguments are checked against its helper
+        before anything runs.  Execution stops at the first failing step,
+        whose error is reported in its result alongside the earlier results.
+        """
+        if len(steps) > MAX_BATCH_STEPS:
+            raise ValueError(f"steps must include at most {MAX_BATCH_STEPS} entries.")
+        plan: List[Tuple[str, Dict[str, Any]]] = []
+        for step in steps:
+            if not isinstance(step, Mapping):
+                raise TypeError('each step must be a mapping like {"op": ..., "args": {...}}.')
+            op = step.get("op")
+            if op not in BATCHABLE_OPERATIONS:
+                raise ValueError(
+                    "op must be one of {%s}." % ", ".join(sorted(BATCHABLE_OPERATIONS))
+                )
+            args = step.get("args") or {}
+            if not isinstance(args, Mapping):
+                raise TypeError("step args must be a mapping.")
+            # Batch results must stay JSON-serialisable for the MCP tool.
+            if op == "screenshot" and args.get("encode") == "raw":
+                raise ValueError("screenshot steps must use encode='base64' or 'data_uri'.")
+            # Batches come from MCP clients, which must not write server files.
+            if op == "screenshot" and "output_path" in args:
+                raise ValueError("screenshot steps do not accept output_path.")
+            try:
+                signature(getattr(self, op)).bind(**args)
+            except TypeError as exc:
+                raise TypeError(f"invalid args for {op}: {exc}") from None
+            plan.append((op, dict(args)))
+        if not plan:
+            raise ValueError("steps must include at least one entry.")
+        self._log_call("run_batch", ops=[op for op, _ in plan])
+        results: List[Dict[str, object]] = []
+        completed = True
+        for op, args in plan:
+            try:
+                results.append({"op": op, **getattr(self, op)(**args)})
+            except Error as exc:
+                results.append({"op": op, **_error_payload(exc)})
+                completed = False
+                break
+            except (ValueError, TypeError) as exc:
+                # Argument values only fail once the step runs (e.g. a bad
+                # wait_until); keep the results of the steps that already ran.
+                results.append({"op": op, "error": "invalid", "message": str(exc)})
+                completed = False
+                break
+        result = {"results": results, "count": len(results), "completed": completed}
+        self._log_result("run_batch", result)
+        return result
+
+    def describe_dom(
+        self,
+        url: Optional[str] = None,
+        *,
+        wait_until: str = "domcontentloaded",
     ) -> Dict[str, object]:
         """Return a high-level structural outline of the current page."""
         self._log_call("describe_dom", url=url, wait_until=wait_until)
@@ -621,8 +1163,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         with self._open_page(url, wait_until=wait_until) as page:
             summary = page.evaluate(script)
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "dom": summary,
             }
             self._log_result("describe_dom", result)
@@ -632,7 +1173,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         self,
         url: Optional[str] = None,
         *,
-        wait_until: str = "load",
+        wait_until: str = "domcontentloaded",
         include_values: bool = True,
     ) -> Dict[str, object]:
         """Inspect forms on the page and return structured field metadata."""
@@ -640,6 +1181,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         script = """
         ({ includeValues }) => {
             const forms = Array.from(document.forms || []);
+            const buttonTypes = new Set(['submit', 'button', 'reset', 'image']);
             const describeControl = (control) => {
                 const tag = control.tagName.toLowerCase();
                 const typeAttr = control.getAttribute('type');
@@ -712,33 +1254,25 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
             };
 
             return forms.map((form, index) => {
-                const controls = Array.from(form.querySelectorAll('input, textarea, select, button'));
-                const fields = controls
-                    .filter((el) => {
-                        const tag = el.tagName.toLowerCase();
-                        if (tag === 'button') {
-                            return false;
-                        }
-                        const type = (el.getAttribute('type') || '').toLowerCase();
-                        return !['submit', 'button', 'reset', 'image'].includes(type);
-                    })
-                    .map(describeControl);
-
-                const submitControls = controls
-                    .filter((el) => {
-                        const tag = el.tagName.toLowerCase();
-                        const type = (el.getAttribute('type') || '').toLowerCase();
-                        return tag === 'button' || ['submit', 'button', 'reset', 'image'].includes(type);
-                    })
-                    .map((el, submitIndex) => ({
-                        index: submitIndex + 1,
-                        tag: el.tagName.toLowerCase(),
-                        type: (el.getAttribute('type') || (el.tagName.toLowerCase() === 'button' ? 'submit' : '')).toLowerCase(),
+                const fields = [];
+                const submitControls = [];
+                form.querySelectorAll('input, textarea, select, button').forEach((el) => {
+                    const tag = el.tagName.toLowerCase();
+                    const type = (el.getAttribute('type') || '').toLowerCase();
+                    if (tag !== 'button' && !buttonTypes.has(type)) {
+                        fields.push(describeControl(el));
+                        return;
+                    }
+                    submitControls.push({
+                        index: submitControls.length + 1,
+                        tag,
+                        type: type || (tag === 'button' ? 'submit' : ''),
                         text: (el.innerText || el.value || '').trim(),
                         name: el.getAttribute('name') || null,
                         id: el.id || null,
                         aria_label: el.getAttribute('aria-label') || null,
-                    }));
+                    });
+                });
 
                 return {
                     index: index + 1,
@@ -756,8 +1290,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         with self._open_page(url, wait_until=wait_until) as page:
             forms = page.evaluate(script, {"includeValues": include_values})
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "forms": forms,
                 "count": len(forms),
             }
@@ -768,7 +1301,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         self,
         url: Optional[str] = None,
         *,
-        wait_until: str = "load",
+        wait_until: str = "domcontentloaded",
     ) -> Dict[str, object]:
         """Return metadata about buttons and button-like elements on the page."""
         self._log_call("list_buttons", url=url, wait_until=wait_until)
@@ -813,14 +1346,79 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         with self._open_page(url, wait_until=wait_until) as page:
             buttons = page.evaluate(script)
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page),
                 "buttons": buttons,
                 "count": len(buttons),
             }
             self._log_result("list_buttons", result)
             return result
 
+    def list_tables(
+        self,
+        url: Optional[str] = None,
+        *,
+        wait_until: str = "domcontentloaded",
+        limit: Optional[int] = 20,
+        max_rows: Optional[int] = 50,
+    ) -> Dict[str, object]:
+        """Return captions, headers, and cell text for tables on the page.
+
+        All tables are read in a single ``page.evaluate`` call; ``limit``
+        caps the number of tables and ``max_rows`` the body rows per table.
+        """
+        self._log_call(
+            "list_tables",
+            url=url,
+            wait_until=wait_until,
+            limit=limit,
+            max_rows=max_rows,
+        )
+        script = """
+        ({ limit, maxRows }) => {
+            const cellText = (cell) => (cell.innerText || '').trim();
+            const tables = document.querySelectorAll('table');
+            const count = limit === null || limit === undefined ? tables.length : Math.min(limit, tables.length);
+            const result = [];
+            for (let index = 0; index < count; index++) {
+                const table = tables[index];
+                const rows = Array.from(table.rows || []);
+                let headerRow = table.tHead && table.tHead.rows.length ? table.tHead.rows[0] : null;
+                if (!headerRow && rows.length && rows[0].querySelector('th') && !rows[0].querySelector('td')) {
+                    headerRow = rows[0];
+                }
+                const headers = headerRow ? Array.from(headerRow.cells).map(cellText) : [];
+                const bodyRows = rows.filter((row) => row !== headerRow && !(table.tHead && table.tHead.contains(row)));
+                const rowLimit = maxRows === null || maxRows === undefined ? bodyRows.length : Math.min(maxRows, bodyRows.length);
+                const cells = new Array(rowLimit);
+                for (let rowIndex = 0; rowIndex < rowLimit; rowIndex++) {
+                    cells[rowIndex] = Array.from(bodyRows[rowIndex].cells).map(cellText);
+                }
+                result.push({
+                    index: index + 1,
+                    id: table.id || null,
+                    caption: table.caption ? cellText(table.caption) : null,
+                    headers,
+                    rows: cells,
+                    row_count: bodyRows.length,
+                    truncated: rowLimit < bodyRows.length,
+                });
+            }
+            return { tables: result, total: tables.length };
+        }
+        """
+        with self._open_page(url, wait_until=wait_until) as page:
+            summary = page.evaluate(script, {"limit": limit, "maxRows": max_rows})
+            tables = list(summary.get("tables") or [])
+            total = int(summary.get("total") or 0)
+            result = {
+                **self._page_summary(page),
+                "tables": tables,
+                "count": total,
+                "truncated": len(tables) < total,
+            }
+            self._log_result("list_tables", result)
+            return result
+
     def evaluate_js(
         self,
         url: Optional[str] = None,
@@ -846,8 +1444,7 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
                 logger.exception("evaluate_js failed: %s", exc)
                 raise
             result = {
-                "final_url": page.url,
-                "title": page.title(),
+                **self._page_summary(page, fresh=True),
                 "result": outcome,
             }
             self._log_result("evaluate_js", result)
@@ -859,20 +1456,201 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
 
     def _ensure_browser(self) -> Browser:
         self.startup()
+        if self._user_data_dir is not None:
+            raise RuntimeError(
+                "Separate browser contexts are unavailable with user_data_dir; "
+                "the persistent profile manages sessions itself."
+            )
         if self._browser is None:
             raise RuntimeError("Playwright failed to launch Chromium.")
         return self._browser
 
+    def _capture_cdp(
+        self,
+        page: Page,
+        *,
+        image_format: str,
+        quality: Optional[int],
+        selector: Optional[str] = None,
+        full_page: bool = False,
+    ) -> str:
+        """Capture via ``Page.captureScreenshot`` and return Chromium's base64."""
+        session = self._cdp_sessions.get(page)
+        if session is None:
+            session = page.context.new_cdp_session(page)
+            self._cdp_sessions[page] = session
+        params: Dict[str, Any] = {"format": image_format, "optimizeForSpeed": True}
+        if quality is not None:
+            params["quality"] = quality
+        if selector or full_page:
+            if selector:
+                with self._element(page, selector, timeout=self._default_timeout_ms) as element:
+                    if element is None:
+                        raise RuntimeError(f"selector {selector!r} not found.")
+                    element.scroll_into_view_if_needed()
+                    box = element.bounding_box()
+                if box is None:
+                    raise RuntimeError(f"selector {selector!r} is not visible.")
+                # Read after scrolling: clips are in page, not viewport, space.
+                viewport = session.send("Page.getLayoutMetrics")["cssLayoutViewport"]
+                clip = {
+                    "x": box["x"] + viewport["pageX"],
+                    "y": box["y"] + viewport["pageY"],
+                    "width": box["width"],
+                    "height": box["height"],
+                }
+            else:
+                size = session.send("Page.getLayoutMetrics")["cssContentSize"]
+                clip = {"x": 0, "y": 0, "width": size["width"], "height": size["height"]}
+            params["clip"] = {**clip, "scale": 1}
+            params["captureBeyondViewport"] = True
+        return session.send("Page.captureScreenshot", params)["data"]
+
+    @contextmanager
+    def _element(
+        self,
+        page: Page,
+        selector: str,
+        *,
+        timeout: int,
+    ) -> Iterator[Optional[ElementHandle]]:
+        """Wait for ``selector`` and dispose the handle once the caller is done."""
+        element = page.wait_for_selector(selector, timeout=timeout)
+        try:
+            yield element
+        finally:
+            self._dispose(element)
+
+    def _dispose(self, element: Optional[ElementHandle]) -> None:
+        # Release the CDP-side object now instead of whenever Python collects it.
+        if element is None:
+            return
+        try:
+            element.dispose()
+        except Error:
+            pass
+
+    def _validate_screenshot_options(
+        self, image_format: str, quality: Optional[int], encode: str
+    ) -> Optional[int]:
+        valid_formats = {"png", "jpeg", "webp"}
+        if image_format not in valid_formats:
+            raise ValueError(f"image_format must be one of {valid_formats}.")
+        if encode not in {"base64", "data_uri", "raw"}:
+            raise ValueError("encode must be one of {base64, data_uri, raw}.")
+        if image_format in {"jpeg", "webp"} and quality is None:
+            return DEFAULT_JPEG_QUALITY
+        return quality
+
+    def _capture_screenshot(
+        self,
+        page: Page,
+        *,
+        selector: Optional[str],
+        full_page: bool,
+        image_format: str,
+        quality: Optional[int],
+        encode: str,
+        output_path: Optional[str | Path] = None,
+    ) -> Dict[str, object]:
+        if output_path is not None:
+            return self._save_screenshot(
+                page,
+                Path(output_path).expanduser(),
+                selector=selector,
+                full_page=full_page,
+                image_format=image_format,
+                quality=quality,
+            )
+        # CDP captures come back base64-encoded; Playwright's own
+        # ``screenshot`` always returns bytes.
+        if image_format not in _PLAYWRIGHT_IMAGE_FORMATS:
+            encoded = self._capture_cdp(
+                page,
+                image_format=image_format,
+                quality=quality,
+                selector=selector,
+                full_page=full_page,
+            )
+            if encode == "raw":
+                return {"screenshot": base64.b64decode(encoded)}
+            return _encoded_screenshot(encoded, image_format, encode)
+        if not selector and not full_page and encode != "raw":
+            # Viewport captures go straight to CDP: Chromium hands back
+            # base64 already, so there is nothing to encode here.
+            encoded = self._capture_cdp(page, image_format=image_format, quality=quality)
+            return _encoded_screenshot(encoded, image_format, encode)
+        if selector:
+            with self._element(page, selector, timeout=self._default_timeout_ms) as element:
+                data = element.screenshot(type=image_format, quality=quality)
+        else:
+            data = page.screenshot(full_page=full_page, type=image_format, quality=quality)
+        if encode == "raw":
+            return {"screenshot": data}
+        return _encoded_screenshot(_b64encode_str(data), image_format, encode)
+
+    def _save_screenshot(
+        self,
+        page: Page,
+        path: Path,
+        *,
+        selector: Optional[str],
+        full_page: bool,
+        image_format: str,
+        quality: Optional[int],
+    ) -> Dict[str, object]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if image_format not in _PLAYWRIGHT_IMAGE_FORMATS:
+            encoded = self._capture_cdp(
+                page,
+                image_format=image_format,
+                quality=quality,
+                selector=selector,
+                full_page=full_page,
+            )
+            path.write_bytes(base64.b64decode(encoded))
+        elif selector:
+            with self._element(page, selector, timeout=self._default_timeout_ms) as element:
+                element.screenshot(path=path, type=image_format, quality=quality)
+        else:
+            page.screenshot(path=path, full_page=full_page, type=image_format, quality=quality)
+        return {"screenshot_path": str(path)}
+
+    def _page_summary(
+        self,
+        page: Page,
+        *,
+        include_title: bool = True,
+        fresh: bool = False,
+    ) -> Dict[str, str]:
+        """Read the final URL and title once for a result payload.
+
+        On the persistent page the title is memoised until the main frame
+        navigates; helpers that may mutate the page pass ``fresh=True``.
+        """
+        summary = {"final_url": page.url}
+        if not include_title:
+            return summary
+        if page is not self._page:
+            summary["title"] = page.title()
+            return summary
+        if fresh or self._cached_title is None:
+            self._cached_title = page.title()
+        summary["title"] = self._cached_title
+        return summary
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        if frame.parent_frame is None:
+            self._cached_title = None
+
     def _validate_wait_state(self, wait_until: str) -> str:
         if wait_until not in ALLOWED_WAIT_STATES:
-            allowed = ", ".join(sorted(ALLOWED_WAIT_STATES))
-            raise ValueError(f"wait_until must be one of {{{allowed}}}.")
+            raise ValueError(_WAIT_STATE_ERROR)
         return wait_until
 
     def _validate_selector_state(self, state: str) -> str:
         if state not in ALLOWED_SELECTOR_STATES:
-            allowed = ", ".join(sorted(ALLOWED_SELECTOR_STATES))
-            raise ValueError(f"state must be one of {{{allowed}}}.")
+            raise ValueError(_SELECTOR_STATE_ERROR)
         return state
 
     def _normalize_fields(
@@ -884,22 +1662,20 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         instructions: List[FieldInstruction] = []
         if isinstance(fields, Mapping):
             for selector, value in fields.items():
-                instructions.append({"selector": selector, "value": value})
+                instructions.append({"selector": _clean_selector(selector), "value": value})
         else:
             for entry in fields:
                 if isinstance(entry, dict):
                     if "selector" not in entry or "value" not in entry:
                         raise ValueError("Each field mapping must include 'selector' and 'value'.")
                     item: FieldInstruction = {
-                        "selector": entry["selector"],
+                        "selector": _clean_selector(entry["selector"]),
                         "value": entry["value"],
                     }
-                    if "strategy" in entry:
-                        item["strategy"] = entry["strategy"]
-                    elif "mode" in entry:
-                        item["strategy"] = entry["mode"]
-                    elif "action" in entry:
-                        item["strategy"] = entry["action"]
+                    for alias in _STRATEGY_ALIASES:
+                        if alias in entry:
+                            item["strategy"] = entry[alias]
+                            break
                     if "clear" in entry:
                         item["clear"] = bool(entry["clear"])
                     if "delay" in entry:
@@ -907,21 +1683,15 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
                     instructions.append(item)
                 elif isinstance(entry, (list, tuple)) and len(entry) == 2:
                     selector, value = entry
-                    instructions.append({"selector": selector, "value": value})
+                    instructions.append({"selector": _clean_selector(selector), "value": value})
                 else:
                     raise TypeError(
                         "fields must be a mapping, or a sequence of "
                         "two-tuples/mappings with 'selector' and 'value'."
                     )
-        normalized: List[FieldInstruction] = []
-        for item in instructions:
-            selector = str(item.get("selector") or "").strip()
-            if not selector:
-                raise ValueError("Field selector must be a non-empty string.")
-            normalized.append({**item, "selector": selector})
-        if not normalized:
+        if not instructions:
             raise ValueError("fields must include at least one entry.")
-        return normalized
+        return instructions
 
     def _fill_fields_on_page(
         self,
@@ -930,72 +1700,158 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         *,
         timeout: int,
         clear: bool,
+        batch: bool = False,
     ) -> List[Dict[str, object]]:
         results: List[Dict[str, object]] = []
-        allowed_strategies = {"fill", "type", "check", "uncheck", "select"}
-        for instruction in instructions:
+        batched = self._batch_fill(page, instructions, clear=clear) if batch else {}
+        for index, instruction in enumerate(instructions):
             selector = instruction["selector"]
-            value = instruction.get("value")
-            strategy_raw = instruction.get("strategy")
-            strategy = strategy_raw.lower() if isinstance(strategy_raw, str) else None
-            entry_clear = bool(instruction.get("clear")) if "clear" in instruction else clear
-
-            action = ""
-            if strategy and strategy not in allowed_strategies:
-                raise ValueError(f"Unsupported field strategy: {strategy_raw!r}.")
-
-            if strategy in {"check", "uncheck"}:
-                should_check = strategy == "check"
-            elif isinstance(value, bool):
-                should_check = value
-                strategy = "check" if value else "uncheck"
-            else:
-                should_check = None
-
-            if should_check is not None:
-                locator = page.locator(selector)
-                if bool(should_check):
-                    locator.check(timeout=timeout)
-                    action = "check"
-                    effective_value: object = True
-                else:
-                    locator.uncheck(timeout=timeout)
-                    action = "uncheck"
-                    effective_value = False
-            elif strategy == "select" or self._is_select_value(value):
-                selected = self._select_option(page, selector, value, timeout=timeout)
-                action = "select"
-                effective_value = selected
-            elif strategy == "type" or not entry_clear:
-                text = "" if value is None else str(value)
-                delay = instruction.get("delay")
-                type_kwargs = {"delay": float(delay)} if isinstance(delay, (int, float)) else {}
-                page.type(selector, text, timeout=timeout, **type_kwargs)
-                action = "type"
-                effective_value = text
-            else:
+            if index in batched:
+                action, value = batched[index]
+                results.append({"selector": selector, "action": action, "value": value})
+                continue
+            action = self._resolve_field_strategy(instruction, clear=clear)
+            effective_value = self._field_handlers[action](page, instruction, timeout)
+            results.append({"selector": selector, "action": action, "value": effective_value})
+        return results
+
+    def _resolve_field_strategy(self, instruction: FieldInstruction, *, clear: bool) -> str:
+        strategy_raw = instruction.get("strategy")
+        strategy = strategy_raw.lower() if isinstance(strategy_raw, str) else None
+        if strategy and strategy not in _FIELD_STRATEGIES:
+            raise ValueError(f"Unsupported field strategy: {strategy_raw!r}.")
+        value = instruction.get("value")
+        if strategy in {"check", "uncheck"}:
+            return strategy
+        if isinstance(value, bool):
+            return "check" if value else "uncheck"
+        if strategy == "select" or self._is_select_value(value):
+            return "select"
+        entry_clear = bool(instruction.get("clear")) if "clear" in instruction else clear
+        if strategy == "type" or not entry_clear:
+            return "type"
+        return "fill"
+
+    def _apply_check(self, page: Page, instruction: FieldInstruction, timeout: int) -> object:
+        page.locator(instruction["selector"]).check(timeout=timeout)
+        return True
+
+    def _apply_uncheck(self, page: Page, instruction: FieldInstruction, timeout: int) -> object:
+        page.locator(instruction["selector"]).uncheck(timeout=timeout)
+        return False
+
+    def _apply_select(self, page: Page, instruction: FieldInstruction, timeout: int) -> object:
+        return self._select_option(
+            page, instruction["selector"], instruction.get("value"), timeout=timeout
+        )
+
+    def _apply_type(self, page: Page, instruction: FieldInstruction, timeout: int) -> object:
+        selector = instruction["selector"]
+        value = instruction.get("value")
+        text = "" if value is None else str(value)
+        delay = instruction.get("delay")
+        if isinstance(delay, (int, float)) and delay > 0:
+            page.type(selector, text, timeout=timeout, delay=float(delay))
+        else:
+            # Without a delay nobody is watching individual keys: insert the
+            # text at the caret in one input event rather than dispatching
+            # four key events per character.
+            page.focus(selector, timeout=timeout)
+            page.keyboard.insert_text(text)
+        return text
+
+    def _apply_fill(self, page: Page, instruction: FieldInstruction, timeout: int) -> object:
+        value = instruction.get("value")
+        text = "" if value is None else str(value)
+        page.fill(instruction["selector"], text, timeout=timeout)
+        return text
+
+    def _batch_fill(
+        self,
+        page: Page,
+        instructions: Sequence[FieldInstruction],
+        *,
+        clear: bool,
+    ) -> Dict[int, Tuple[str, object]]:
+        """Set every plain text field and checkbox in one round-trip.
+
+        Returns the instruction indices that were handled, mapped to the
+        action and value applied; anything else is left for the per-field
+        Playwright path.
+        """
+        specs: List[Dict[str, Any]] = []
+        for index, instruction in enumerate(instructions):
+            action = self._resolve_field_strategy(instruction, clear=clear)
+            if action in {"check", "uncheck"}:
+                specs.append(
+                    {"index": index, "selector": instruction["selector"], "checked": action == "check"}
+                )
+            elif action == "fill":
+                value = instruction.get("value")
                 text = "" if value is None else str(value)
-                page.fill(selector, text, timeout=timeout)
-                action = "fill"
-                effective_value = text
-
-            results.append(
-                {
-                    "selector": selector,
-                    "action": action or "fill",
-                    "value": effective_value,
+                specs.append({"index": index, "selector": instruction["selector"], "value": text})
+        if not specs:
+            return {}
+        script = """
+        (specs) => specs.map(({ index, selector, value, checked }) => {
+            let element = null;
+            try {
+                element = document.querySelector(selector);
+            } catch (error) {
+                return null;
+            }
+            if (!element || element.disabled) {
+                return null;
+            }
+            if (checked !== undefined) {
+                const type = (element.type || '').toLowerCase();
+                if (type !== 'checkbox' && !(type === 'radio' && checked)) {
+                    return null;
+                }
+                // A real click toggles the state and fires the usual events.
+                if (element.checked !== checked) {
+                    element.click();
                 }
+                return element.checked === checked ? index : null;
+            }
+            if (element.readOnly) {
+                return null;
+            }
+            const tag = element.tagName.toLowerCase();
+            if (tag !== 'input' && tag !== 'textarea') {
+                return null;
+            }
+            // Use the native setter so framework-controlled inputs notice the change.
+            const proto = tag === 'textarea' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+            element.focus();
+            setter.call(element, value);
+            element.dispatchEvent(new Event('input', { bubbles: true }));
+            element.dispatchEvent(new Event('change', { bubbles: true }));
+            return index;
+        })
+        """
+        done = page.evaluate(script, specs)
+        applied = {
+            spec["index"]: (
+                ("check" if spec["checked"] else "uncheck", spec["checked"])
+                if "checked" in spec
+                else ("fill", spec["value"])
             )
-        return results
+            for spec in specs
+        }
+        return {index: applied[index] for index in done if index is not None}
 
     def _is_select_value(self, value: Any) -> bool:
+        """Return whether ``value`` looks like ``select_option`` input.
+
+        Lists are classified by their first item only; an empty list still
+        counts (it clears a multi-select).
+        """
         if isinstance(value, dict):
-            return any(key in value for key in ("value", "label", "index"))
+            return "value" in value or "label" in value or "index" in value
         if isinstance(value, (list, tuple)):
-            return all(
-                isinstance(item, (str, dict))
-                for item in value
-            )
+            return not value or isinstance(value[0], (str, dict))
         return False
 
     def _select_option(
@@ -1032,124 +1888,509 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
     def _storage_state_for_url(self, url: Optional[str]) -> Optional[Path]:
         if not url:
             return None
-        host = urlparse(url).hostname
+        host = _hostname(url)
         if not host:
             return None
-        return self._storage_state_for_host(host)
+        path = self._storage_state_for_host(host)
+        if path is None and self._default_storage_state is not None:
+            if self._default_storage_state.exists():
+                return self._default_storage_state
+        return path
 
     def _storage_state_for_host(self, host: str) -> Optional[Path]:
-        candidate = host.lower()
-        while candidate:
-            cfg = self._domain_configs.get(candidate)
-            if cfg:
-                path = cfg.storage_state_path
-                if path.exists():
-                    self._storage_state_cache[candidate] = path
-                    return path
-            if "." not in candidate:
-                break
-            candidate = candidate.split(".", 1)[1]
+        for domain in self._config_domains_for_host(host):
+            # Known sessions skip the stat; misses re-check in case a login
+            # has written the file since.
+            path = self._storage_state_cache.get(domain)
+            if path is not None:
+                return path
+            path = self._domain_configs[domain].storage_state_path
+            if path.exists():
+                self._storage_state_cache[domain] = path
+                return path
         return None
 
+    def _config_domains_for_host(self, host: str) -> Tuple[str, ...]:
+        """Return configured domains covering ``host``, most specific first.
+
+        Memoised per host so the common case (no configuration for the
+        host) costs a single dict lookup.
+        """
+        domains = self._host_config_domains.get(host)
+        if domains is None:
+            matches: List[str] = []
+            candidate = host.lower()
+            while candidate:
+                if candidate in self._domain_configs:
+                    matches.append(candidate)
+                if "." not in candidate:
+                    break
+                candidate = candidate.split(".", 1)[1]
+            domains = self._host_config_domains[host] = tuple(matches)
+        return domains
+
+    def _load_storage_state(self, path: Optional[Path]) -> Optional[Dict[str, Any]]:
+        """Return the parsed storage state at ``path``.
+
+        The file's ``st_mtime_ns`` acts as the cache signature, so a refreshed
+        login is picked up on the very next call without any TTL.
+        """
+        if path is None:
+            return None
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._storage_state_payloads.pop(path, None)
+            self._storage_state_cache = {
+                domain: cached
+                for domain, cached in self._storage_state_cache.items()
+                if cached != path
+            }
+            return None
+        cached = self._storage_state_payloads.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        payload = json.loads(path.read_bytes())
+        self._storage_state_payloads[path] = (mtime, payload)
+        return payload
+
+    def _session_is_fresh(self, config: DomainConfig) -> bool:
+        if config.max_age_s is None:
+            return True
+        try:
+            age = time.time() - config.storage_state_path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return age <= config.max_age_s
+
+    def _refresh_storage_state(self, config: DomainConfig) -> bool:
+        """Reload the cached session headlessly and re-save its cookies.
+
+        Returns ``False`` when the page does not look logged in (see
+        ``_is_logged_in_url`` and ``DomainConfig.success_selector``), and
+        always with ``user_data_dir`` so the manual flow renews the session.
+        """
+        if self._user_data_dir is not None:
+            # The persistent profile is the only context this bot may open,
+            # so there is no separate headless context to refresh in.
+            logger.info(
+                "Skipping headless refresh for %s with user_data_dir", config.domain
+            )
+            return False
+        logger.info("Refreshing cached session for %s", config.domain)
+        browser = self._ensure_browser()
+        context = browser.new_context(
+            storage_state=self._load_storage_state(config.storage_state_path)
+        )
+        try:
+            page = context.new_page()
+            page.goto(f"https://{config.domain}/", wait_until="domcontentloaded")
+            # Without success_url_pattern/success_selector this only notices
+            # sites that bounce expired sessions to a login page (e.g. Gmail's
+            # redirect to accounts.google.com); configure them otherwise.
+            if not _is_logged_in_url(page.url, config):
+                logger.info("Cached session for %s has expired", config.domain)
+                return False
+            if config.success_selector:
+                try:
+                    page.locator(config.success_selector).first.wait_for(
+                        state="attached", timeout=self._default_timeout_ms
+                    )
+                except PlaywrightTimeoutError:
+                    logger.info("Cached session for %s has expired", config.domain)
+                    return False
+            self._save_storage_state(context, config)
+            return True
+        except Error as exc:
+            logger.warning("Session refresh for %s failed: %s", config.domain, exc)
+            return False
+        finally:
+            context.close()
+
+    def _save_storage_state(self, context: BrowserContext, config: DomainConfig) -> None:
+        """Write only the cookies and origins that apply to ``config.domain``.
+
+        Login flows collect state for every site they bounce through; keeping
+        just the domain's share keeps the file small to re-parse and hydrate.
+        """
+        state = context.storage_state()
+        state["cookies"] = [
+            cookie
+            for cookie in state.get("cookies", [])
+            if _cookie_applies(cookie.get("domain", ""), config.domain)
+        ]
+        state["origins"] = [
+            origin
+            for origin in state.get("origins", [])
+            if _host_matches(origin.get("origin", ""), config.domain)
+        ]
+        # Storage directories are only created once there is a session to write.
+        config.storage_state_path.parent.mkdir(parents=True, exist_ok=True)
+        config.storage_state_path.write_text(json.dumps(state), encoding="utf-8")
+
     def _run_manual_login(self, config: DomainConfig) -> None:
-        from playwright.sync_api import sync_playwright
+        """Open a headed browser and wait for the user to finish logging in.
 
+        Completion is detected from the page (see ``_wait_for_login``) rather
+        than by reading stdin, so the flow is safe to run from the MCP server
+        (whose STDIO transport owns stdin).
+        """
         logger.info("Starting manual login for domain %s", config.domain)
-        print(config.instructions)
-        with sync_playwright() as playwright:
-            launch_kwargs = dict(config.launch_options)
-            headless = launch_kwargs.pop("headless", False)
-            browser = playwright.chromium.launch(headless=headless, **launch_kwargs)
-            try:
-                context = browser.new_context(**config.context_options)
-                page = context.new_page()
-                page.goto(config.login_url)
-                input("Press Enter after the login completes...")
-                context.storage_state(path=str(config.storage_state_path))
-            finally:
-                browser.close()
+        print(config.instructions, file=sys.stderr, flush=True)
+        self.startup()
+        assert self._playwright is not None
+        launch_kwargs = dict(config.launch_options)
+        headless = launch_kwargs.pop("headless", False)
+        browser = self._playwright.chromium.launch(headless=headless, **launch_kwargs)
+        try:
+            context = browser.new_context(**config.context_options)
+            page = context.new_page()
+            page.goto(config.login_url)
+            _wait_for_login(page, config, config.login_timeout_s * 1000)
+            self._save_storage_state(context, config)
+        finally:
+            browser.close()
         logger.info(
             "Stored session for %s at %s", config.domain, config.storage_state_path
         )
 
+    def _run_profile_login(self, config: DomainConfig) -> None:
+        """Log in inside the ``user_data_dir`` profile the bot browses with.
+
+        A separate browser's storage-state file would never reach the
+        profile, so the user signs in through the profile's own window.
+        """
+        if self._headless:
+            raise RuntimeError(
+                f"Logging in to {config.domain!r} with user_data_dir needs "
+                "headless=False: the login runs in the profile's own window."
+            )
+        logger.info("Starting manual login for domain %s in profile", config.domain)
+        print(config.instructions, file=sys.stderr, flush=True)
+        page = self._ensure_user_data_page()
+        page.goto(config.login_url)
+        _wait_for_login(page, config, config.login_timeout_s * 1000)
+        # The snapshot only records when the profile last logged in.
+        self._save_storage_state(page.context, config)
+
     def _invalidate_persistent_context(self) -> None:
         self._close_persistent_context()
+        self._drain_context_pool()
         self._current_storage_state_key = None
 
+    def _block_resources(
+        self, page: Page, blocked: frozenset[str]
+    ) -> Optional[Callable[[Route], None]]:
+        if not blocked:
+            return None
+
+        def handler(route: Route) -> None:
+            if route.request.resource_type in blocked:
+                route.abort()
+            else:
+                route.continue_()
+
+        page.route("**/*", handler)
+        return handler
+
+    def _goto_until_selector(
+        self, page: Page, target: str, selector: str, timeout_ms: Optional[int]
+    ) -> None:
+        # Return once the navigation commits and the element exists instead of
+        # serialising the full load before the selector wait.
+        page.goto(target, wait_until="commit")
+        page.locator(selector).first.wait_for(
+            state="attached", timeout=timeout_ms or self._default_timeout_ms
+        )
+
     def _close_persistent_context(self) -> None:
-        if self._page is not None:
-            try:
-                if not self._page.is_closed():
-                    self._page.close()
-            except Exception:
-                pass
-            finally:
-                self._page = None
-        if self._context is not None:
-            try:
-                self._context.close()
-            except Exception:
-                pass
-            finally:
-                self._context = None
+        page, self._page = self._page, None
+        context, self._context = self._context, None
+        if context is None:
+            if page is not None and not page.is_closed():
+                page.close()
+            return
+        # Closing the context closes its pages too; errors here only mean the
+        # browser already went away underneath us.
+        try:
+            context.close()
+        except Error as exc:
+            logger.debug("Ignoring error while closing persistent context: %s", exc)
 
 
     @contextmanager
-    def _open_page(self, url: Optional[str], *, wait_until: str) -> Iterator[Page]:
+    def _open_page(
+        self,
+        url: Optional[str],
+        *,
+        wait_until: str,
+        early_selector: Optional[str] = None,
+        timeout_ms: Optional[int] = None,
+        skip_resources: Optional[Sequence[str]] = None,
+    ) -> Iterator[Page]:
+        """Yield a page loaded to ``wait_until``.
+
+        With ``early_selector`` a fresh navigation only waits until that
+        selector is attached, which is usually well before the load state.
+        ``skip_resources`` aborts requests of those Playwright resource
+        types (e.g. ``"image"``) for the duration of the call.
+        """
         wait_state = self._validate_wait_state(wait_until)
+        blocked = _validate_resource_types(skip_resources)
         storage_state = self._storage_state_for_url(url)
         if self._persist_context:
-            page = self._ensure_persistent_page(storage_state)
-            if url:
-                target = url.strip()
-                if not target:
-                    raise ValueError("url must be a non-empty string.")
-                if self._urls_differ(page.url, target):
-                    page.goto(target, wait_until=wait_state)
-                page.wait_for_load_state(wait_state)
-            elif not page.url:
-                raise ValueError(
-                    "A non-empty url is required for the initial navigation when "
-                    "persist_context is enabled."
-                )
-            else:
-                page.wait_for_load_state(wait_state)
-            yield page
+            page = self._ensure_persistent_page(storage_state, keep_current=not url)
+            blocker = self._block_resources(page, blocked)
+            try:
+                if url:
+                    target = url.strip()
+                    if not target:
+                        raise ValueError("url must be a non-empty string.")
+                    if not self._urls_differ(page.url, target):
+                        page.wait_for_load_state(wait_state)
+                    elif early_selector:
+                        self._goto_until_selector(page, target, early_selector, timeout_ms)
+                    else:
+                        page.goto(target, wait_until=wait_state)
+                elif not page.url:
+                    raise ValueError(
+                        "A non-empty url is required for the initial navigation when "
+                        "persist_context is enabled."
+                    )
+                else:
+                    page.wait_for_load_state(wait_state)
+                yield page
+            finally:
+                if blocker is not None and not page.is_closed():
+                    page.unroute("**/*", blocker)
         else:
             if not url:
                 raise ValueError("url must be a non-empty string.")
             target = url.strip()
             if not target:
                 raise ValueError("url must be a non-empty string.")
-            browser = self._ensure_browser()
-            context = browser.new_context(
-                storage_state=str(storage_state) if storage_state else None
-            )
-            page = context.new_page()
+            entry = self._acquire_context(storage_state)
+            reusable = False
+            blocker = self._block_resources(entry.page, blocked)
             try:
-                page.goto(target, wait_until=wait_state)
-                yield page
+                if early_selector:
+                    self._goto_until_selector(entry.page, target, early_selector, timeout_ms)
+                else:
+                    entry.page.goto(target, wait_until=wait_state)
+                yield entry.page
+                if blocker is not None:
+                    entry.page.unroute("**/*", blocker)
+                reusable = True
             finally:
-                context.close()
+                if reusable:
+                    self._release_context(entry)
+                else:
+                    self._discard_context(entry)
 
-    def _ensure_persistent_page(self, storage_state: Optional[Path]) -> Page:
-        browser = self._ensure_browser()
+    def _visit_many(
+        self,
+        urls: Sequence[str],
+        *,
+        wait_until: str,
+        max_concurrency: int,
+        handler: Callable[[Page], Dict[str, object]],
+    ) -> List[Dict[str, object]]:
+        """Visit ``urls`` in batches of ``max_concurrency`` pooled pages.
+
+        The sync Playwright API cannot be shared across threads, so overlap
+        comes from committing every navigation in a batch first and only then
+        waiting for each page's load state.  With ``user_data_dir`` the batch
+        opens extra tabs in the profile's single context instead.
+        """
+        wait_state = self._validate_wait_state(wait_until)
+        if not 1 <= max_concurrency <= MAX_CONCURRENCY:
+            raise ValueError(f"max_concurrency must be between 1 and {MAX_CONCURRENCY}.")
+        if len(urls) > MAX_BATCH_URLS:
+            raise ValueError(f"urls must include at most {MAX_BATCH_URLS} entries.")
+        targets = [str(url or "").strip() for url in urls]
+        if not targets or not all(targets):
+            raise ValueError("urls must be a non-empty list of non-empty strings.")
+
+        profile: Optional[BrowserContext] = None
+        if self._user_data_dir is not None:
+            profile = self._ensure_user_data_page().context
+
+        results: List[Dict[str, object]] = []
+        for start in range(0, len(targets), max_concurrency):
+            # Pooled entry (None for profile tabs), its page and any error.
+            batch: List[
+                Tuple[str, Optional[_PooledContext], Page, Optional[Dict[str, object]]]
+            ] = []
+            try:
+                for target in targets[start : start + max_concurrency]:
+                    entry: Optional[_PooledContext] = None
+                    if profile is not None:
+                        page = profile.new_page()
+                    else:
+                        entry = self._acquire_context(self._storage_state_for_url(target))
+                        page = entry.page
+                    error: Optional[Dict[str, object]] = None
+                    try:
+                        page.goto(target, wait_until="commit")
+                    except Error as exc:
+                        error = _error_payload(exc)
+                    batch.append((target, entry, page, error))
+                for index, (target, entry, page, error) in enumerate(batch):
+                    if error is None:
+                        try:
+                            page.wait_for_load_state(wait_state)
+                            results.append({"url": target, **handler(page)})
+                            continue
+                        except Error as exc:
+                            error = _error_payload(exc)
+                            batch[index] = (target, entry, page, error)
+                    results.append({"url": target, **error})
+            finally:
+                for _, entry, page, error in batch:
+                    if entry is None:
+                        page.close()
+                    elif error is None:
+                        self._release_context(entry)
+                    else:
+                        self._discard_context(entry)
+        return results
+
+    def _acquire_context(self, storage_state: Optional[Path]) -> _PooledContext:
+        self._reap_idle_contexts()
+        key = str(storage_state) if storage_state else None
+        for index in range(len(self._context_pool) - 1, -1, -1):
+            entry = self._context_pool[index]
+            if entry.key == key:
+                del self._context_pool[index]
+                if not entry.page.is_closed():
+                    return entry
+                self._discard_context(entry)
+                break
+        context = self._new_context(storage_state=self._load_storage_state(storage_state))
+        return _PooledContext(key=key, context=context, page=context.new_page())
+
+    def _release_context(self, entry: _PooledContext) -> None:
+        if self._context_pool_size == 0 or entry.page.is_closed():
+            self._discard_context(entry)
+            return
+        try:
+            # Park the page on about:blank so the next checkout only pays for
+            # its own navigation and the old document stops running scripts.
+            entry.page.goto("about:blank")
+            if entry.key is None:
+                # Cookies and permissions are cleared; per-origin web storage
+                # is not (Playwright has no API for it), which is why
+                # context_pool_size=0 is the setting for full isolation.
+                entry.context.clear_cookies()
+                entry.context.clear_permissions()
+        except Exception:
+            self._discard_context(entry)
+            return
+        entry.idle_since = time.monotonic()
+        self._context_pool.append(entry)
+        self._reap_idle_contexts()
+        while len(self._context_pool) > self._context_pool_size:
+            self._discard_context(self._context_pool.pop(0))
+
+    def _prewarm_context_pool(self) -> None:
+        # Done inline at startup: a background filler thread cannot use the
+        # sync Playwright API, which is bound to the thread that started it.
+        now = time.monotonic()
+        for _ in range(self._prewarm_contexts):
+            context = self._new_context()
+            self._context_pool.append(
+                _PooledContext(key=None, context=context, page=context.new_page(), idle_since=now)
+            )
+
+    def _reap_idle_contexts(self) -> None:
+        # Reaping happens inline: Playwright's sync API is bound to the thread
+        # that started it, so a background reaper could not close contexts.
+        if not self._context_pool:
+            return
+        cutoff = time.monotonic() - self._context_idle_timeout_s
+        stale = [entry for entry in self._context_pool if entry.idle_since < cutoff]
+        if not stale:
+            return
+        self._context_pool = [
+            entry for entry in self._context_pool if entry.idle_since >= cutoff
+        ]
+        for entry in stale:
+            self._discard_context(entry)
+
+    def _discard_context(self, entry: _PooledContext) -> None:
+        try:
+            entry.context.close()
+        except Exception:
+            pass
+
+    def _drain_context_pool(self) -> None:
+        pool, self._context_pool = self._context_pool, []
+        for entry in pool:
+            self._discard_context(entry)
+
+    def _new_context(self, **options: Any) -> BrowserContext:
+        context = self._ensure_browser().new_context(**options)
+        context.add_init_script(_PAGE_HELPERS_INIT)
+        return context
+
+    def _ensure_user_data_page(self) -> Page:
+        # The profile directory already carries the session, so storage
+        # state files are ignored and the single context is reused.
+        self.startup()
+        context = self._context or self._launch_user_data_context()
+        if self._page is None or self._page.is_closed():
+            self._page = context.pages[0] if context.pages else context.new_page()
+            self._cached_title = None
+            self._page.on("framenavigated", self._on_frame_navigated)
+        return self._page
+
+    def _launch_user_data_context(self) -> BrowserContext:
+        if self._playwright is None or self._user_data_dir is None:
+            raise RuntimeError("Playwright failed to start.")
+        self._user_data_dir.mkdir(parents=True, exist_ok=True)
+        context = self._playwright.chromium.launch_persistent_context(
+            str(self._user_data_dir),
+            headless=self._headless,
+            args=self._launch_args,
+        )
+        context.add_init_script(_PAGE_HELPERS_INIT)
+        context.set_default_timeout(self._default_timeout_ms)
+        self._context = context
+        return context
+
+    def _ensure_persistent_page(
+        self, storage_state: Optional[Path], *, keep_current: bool = False
+    ) -> Page:
+        """Return the persistent page, rebuilding its context when needed.
+
+        ``keep_current`` (calls without a url) reuses whatever context is
+        live.  The default ``storage_state`` snapshot only seeds a new
+        context: it is usually written from the live one, so its appearing
+        on disk is no reason to rebuild.
+        """
+        if self._user_data_dir is not None:
+            return self._ensure_user_data_page()
         storage_key = str(storage_state) if storage_state else None
+        if storage_state is not None and storage_state == self._default_storage_state:
+            storage_key = None
         needs_new_context = (
             self._context is None
             or self._page is None
             or self._page.is_closed()
-            or self._current_storage_state_key != storage_key
+            or (not keep_current and self._current_storage_state_key != storage_key)
         )
         if needs_new_context:
             self._close_persistent_context()
-            state_arg = str(storage_state) if storage_state and storage_state.exists() else None
-            self._context = browser.new_context(storage_state=state_arg)
+            self._context = self._new_context(
+                storage_state=self._load_storage_state(storage_state)
+            )
             try:
                 self._context.set_default_timeout(self._default_timeout_ms)
             except Exception:
                 pass
             self._page = self._context.new_page()
+            self._cached_title = None
+            self._page.on("framenavigated", self._on_frame_navigated)
             try:
                 self._page.set_default_timeout(self._default_timeout_ms)
             except Exception:
@@ -1171,54 +2412,47 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         limit: Optional[int],
         root_selector: Optional[str],
         link_selector: Optional[str],
+        offset: int = 0,
     ) -> Tuple[List[Dict[str, object]], bool, int]:
         selector = link_selector or "a"
-        script = """({ rootSelector, selector, limit }) => {
-            const root = rootSelector ? document.querySelector(rootSelector) : document;
-            if (!root) {
-                return { links: [], truncated: false, total: 0 };
-            }
-            const elements = Array.from(root.querySelectorAll(selector || "a"));
-            const total = elements.length;
-            const unlimited = limit === null || limit === undefined;
-            const truncated = unlimited ? false : total > limit;
-            const slice = truncated ? elements.slice(0, limit) : elements;
-            const links = slice.map((element, index) => ({
-                position: index + 1,
-                href: element.getAttribute("href") ?? "",
-                text: (element.innerText ?? "").trim(),
-                title: element.getAttribute("title"),
-                aria_label: element.getAttribute("aria-label"),
-                target: element.getAttribute("target"),
-                rel: element.getAttribute("rel"),
-            }));
-            return { links, truncated, total };
-        }"""
+        args = {
+            "rootSelector": root_selector,
+            "selector": selector,
+            "limit": limit,
+            "offset": offset,
+        }
 
-        for attempt in range(3):
-            try:
-                result = page.evaluate(
-                    script,
-                    {"rootSelector": root_selector, "selector": selector, "limit": limit},
-                )
-            except Error as exc:
-                if "Execution context was destroyed" in str(exc) and attempt < 2:
-                    page.wait_for_load_state("load")
-                    continue
+        try:
+            result = self._evaluate_collect_links(page, args)
+        except Error as exc:
+            if "Execution context was destroyed" not in str(exc):
                 raise
-            if not result:
-                return [], False, 0
-            links = list(result.get("links") or [])
-            truncated = bool(result.get("truncated"))
-            total = int(result.get("total") or 0)
-            logger.debug(
-                "collect_links result: total=%s truncated=%s returned=%s",
-                total,
-                truncated,
-                len(links),
-            )
-            return links, truncated, total
-        return [], False, 0
+            # A navigation raced the call; wait for the new document's DOM
+            # once and retry a single time instead of looping on "load".
+            page.main_frame.wait_for_load_state("domcontentloaded")
+            result = self._evaluate_collect_links(page, args)
+        if not result:
+            return [], False, 0
+        links = _decode_link_rows(result.get("rows") or "", start=offset + 1)
+        total = int(result.get("total") or 0)
+        truncated = offset + len(links) < total
+        logger.debug(
+            "collect_links result: total=%s truncated=%s returned=%s",
+            total,
+            truncated,
+            len(links),
+        )
+        return links, truncated, total
+
+    def _evaluate_collect_links(
+        self, page: Page, args: Mapping[str, object]
+    ) -> Optional[Dict[str, Any]]:
+        # The installed helper is compiled once per document; only fall back
+        # to shipping the full source if a page clobbered it.
+        result = page.evaluate(_COLLECT_LINKS_CALL, args)
+        if result is None:
+            result = page.evaluate(_COLLECT_LINKS_JS, args)
+        return result
 
     def _log_call(self, action: str, **kwargs: Any) -> None:
         logger.info("%s call: %s", action, {k: v for k, v in kwargs.items() if v is not None})
@@ -1226,10 +2460,18 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
     def _log_result(self, action: str, result: Mapping[str, Any]) -> None:
         summary: Dict[str, Any] = {}
         for key, value in result.items():
-            if key == "screenshot_base64" and isinstance(value, str):
+            if key in {"screenshot_base64", "screenshot_data_uri"} and isinstance(value, str):
                 summary[key] = f"<{len(value)} chars>"
+            elif key == "screenshot" and isinstance(value, bytes):
+                summary[key] = f"<{len(value)} bytes>"
             elif key == "links" and isinstance(value, list):
                 summary[key] = f"<{len(value)} links>"
+            elif key == "results" and isinstance(value, list):
+                summary[key] = f"<{len(value)} results>"
+            elif key == "tables" and isinstance(value, list):
+                summary[key] = f"<{len(value)} tables>"
+            elif key == "text" and isinstance(value, dict):
+                summary[key] = f"<{len(value)} selectors>"
             elif key == "filled" and isinstance(value, list):
                 summary[key] = value
             else:
@@ -1237,17 +2479,171 @@ class BrowserBot(AbstractContextManager["BrowserBot"]):
         logger.info("%s result: %s", action, summary)
 
 
+# One Playwright driver per thread, shared by every bot started on it.  The
+# sync API is bound to the thread that started it, so a process-wide
+# singleton would break bots driven from different executor threads.
+_shared_drivers = threading.local()
+
+
+def _acquire_playwright() -> Playwright:
+    driver: Optional[Playwright] = getattr(_shared_drivers, "playwright", None)
+    if driver is None:
+        driver = sync_playwright().start()
+        _shared_drivers.playwright = driver
+        _shared_drivers.users = 0
+    _shared_drivers.users += 1
+    return driver
+
+
+def _release_playwright(driver: Playwright) -> None:
+    if getattr(_shared_drivers, "playwright", None) is not driver:
+        driver.stop()
+        return
+    _shared_drivers.users -= 1
+    if _shared_drivers.users <= 0:
+        _shared_drivers.playwright = None
+        driver.stop()
+
+
+@dataclass
+class _SharedBrowser:
+    browser: Browser
+    users: int = 0
+
+
+def _acquire_browser(driver: Playwright, *, headless: bool, args: Sequence[str]) -> Browser:
+    """Return this thread's Chromium for ``(headless, args)``, launching it once."""
+    browsers: Dict[Tuple[bool, Tuple[str, ...]], _SharedBrowser] = (
+        _shared_drivers.__dict__.setdefault("browsers", {})
+    )
+    key = (headless, tuple(args))
+    shared = browsers.get(key)
+    if shared is None or not shared.browser.is_connected():
+        shared = _SharedBrowser(driver.chromium.launch(headless=headless, args=list(args)))
+        browsers[key] = shared
+    shared.users += 1
+    return shared.browser
+
+
+def _release_browser(browser: Browser) -> None:
+    browsers: Dict[Tuple[bool, Tuple[str, ...]], _SharedBrowser] = getattr(
+        _shared_drivers, "browsers", {}
+    )
+    for key, shared in browsers.items():
+        if shared.browser is browser:
+            shared.users -= 1
+            if shared.users > 0:
+                return
+            del browsers[key]
+            break
+    browser.close()
+
+
+def _validate_resource_types(kinds: Optional[Sequence[str]]) -> frozenset[str]:
+    if not kinds:
+        return frozenset()
+    blocked = frozenset(kinds)
+    unknown = blocked - _SKIPPABLE_RESOURCE_TYPES
+    if unknown:
+        raise ValueError(
+            "skip_resources must only contain {%s}."
+            % ", ".join(sorted(_SKIPPABLE_RESOURCE_TYPES))
+        )
+    return blocked
+
+
+def _clean_selector(selector: object) -> str:
+    cleaned = str(selector or "").strip()
+    if not cleaned:
+        raise ValueError("Field selector must be a non-empty string.")
+    return cleaned
+
+
+def _encoded_screenshot(encoded: str, image_format: str, encode: str) -> Dict[str, object]:
+    if encode == "data_uri":
+        return {"screenshot_data_uri": f"data:image/{image_format};base64,{encoded}"}
+    return {"screenshot_base64": encoded}
+
+
+def _decode_link_rows(rows: str, *, start: int = 1) -> List[Dict[str, object]]:
+    if not rows:
+        return []
+    links: List[Dict[str, object]] = []
+    for position, row in enumerate(rows.split("\x1e"), start=start):
+        link: Dict[str, object] = {"position": position}
+        for name, value in zip(_LINK_FIELDS, row.split("\x1f")):
+            link[name] = None if value == "\x00" else value
+        links.append(link)
+    return links
+
+
+def _error_payload(exc: Error) -> Dict[str, object]:
+    kind = "timeout" if isinstance(exc, PlaywrightTimeoutError) else "playwright"
+    return {"error": kind, "message": str(exc)}
+
+
+@lru_cache(maxsize=1024)
+def _hostname(url: str) -> str:
+    """Return the lower-cased host of ``url`` (memoised; tools reuse URLs)."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def _host_matches(url: str, domain: str) -> bool:
+    host = _hostname(url)
+    return host == domain or host.endswith(f".{domain}")
+
+
+def _is_logged_in_url(url: str, config: DomainConfig) -> bool:
+    if config.success_url_pattern:
+        return re.search(config.success_url_pattern, url) is not None
+    # The login page itself may live on ``domain``; only leaving it counts.
+    return _host_matches(url, config.domain) and not _same_page(url, config.login_url)
+
+
+def _same_page(url: str, other: str) -> bool:
+    a, b = urlparse(url), urlparse(other)
+    return (a.hostname, a.path.rstrip("/")) == (b.hostname, b.path.rstrip("/"))
+
+
+def _wait_for_login(page: Page, config: DomainConfig, timeout_ms: float) -> None:
+    """Block until ``page`` shows a logged-in session for ``config``."""
+    page.wait_for_url(lambda url: _is_logged_in_url(url, config), timeout=timeout_ms)
+    page.wait_for_load_state("load")
+    if config.success_selector:
+        page.locator(config.success_selector).first.wait_for(
+            state="attached", timeout=timeout_ms
+        )
+
+
+def _cookie_applies(cookie_domain: str, domain: str) -> bool:
+    # A cookie set for ".google.com" is sent to "mail.google.com" as well.
+    cookie_host = cookie_domain.lstrip(".").lower()
+    return bool(cookie_host) and (domain == cookie_host or domain.endswith(f".{cookie_host}"))
+
+
 def create_browserbot(
     *,
     headless: bool = True,
     persist_context: bool = False,
     domain_configs: Optional[Mapping[str, DomainConfig]] = None,
+    context_pool_size: int = DEFAULT_CONTEXT_POOL_SIZE,
+    context_idle_timeout_s: float = DEFAULT_CONTEXT_IDLE_TIMEOUT_S,
+    prewarm_contexts: int = DEFAULT_PREWARM_CONTEXTS,
+    user_data_dir: Optional[str | Path] = None,
+    storage_state: Optional[str | Path] = None,
+    shared_browser: bool = True,
 ) -> BrowserBot:
     """Factory helper for parity with existing usage sites."""
     return BrowserBot(
         headless=headless,
         persist_context=persist_context,
         domain_configs=domain_configs,
+        context_pool_size=context_pool_size,
+        context_idle_timeout_s=context_idle_timeout_s,
+        prewarm_contexts=prewarm_contexts,
+        user_data_dir=user_data_dir,
+        storage_state=storage_state,
+        shared_browser=shared_browser,
     )
 
 
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from threading import Lock
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from fastmcp import Context, FastMCP
+from fastmcp.utilities.types import Image
 from playwright.sync_api import Error, TimeoutError
 
 from botman.browser.core import BrowserBot, create_browserbot
@@ -18,8 +22,36 @@ mcp = FastMCP(name="botman-browser")
 @dataclass
 class _AgentBundle:
     bot: BrowserBot
-    lock: Lock
-
+    # Single worker: calls for one session run in order on one thread, which
+    # is also what the sync Playwright API requires.
+    executor: ThreadPoolExecutor
+    # Recent read-only results, keyed by call; only touched on the event loop.
+    results: Dict[str, Tuple[float, Dict[str, Any]]] = field(default_factory=dict)
+    # Read-only calls queued or running on the executor, keyed like ``results``,
+    # with the generation they were submitted under.
+    inflight: Dict[str, Tuple[int, asyncio.Future]] = field(default_factory=dict)
+    # Bumped by every non-cacheable call; results read under an older
+    # generation may predate a page change and are not cached.
+    generation: int = 0
+
+
+# Read-only helpers whose results may be replayed briefly when they read the
+# current page (``url=None``).  Given a ``url`` they navigate the session's
+# page first, so like any other call they count as a page change and clear
+# the cache.
+_CACHEABLE_METHODS = frozenset(
+    {
+        "list_links",
+        "extract_text",
+        "extract_html",
+        "describe_dom",
+        "list_forms",
+        "list_buttons",
+        "list_tables",
+    }
+)
+_RESULT_CACHE_TTL_S = 2.0
+_RESULT_CACHE_MAX_ENTRIES = 64
 
 _SESSION_KEY_DEFAULT = "__default__"
 _session_config: Dict[str, Any] = {"headless": True, "persist_context": True}
@@ -39,16 +71,14 @@ def configure_browser_agent(
 
 
 def _call_agent(
+    bot: BrowserBot,
     method: str,
-    client_id: Optional[str],
     *args,
     **kwargs,
 ) -> Dict[str, Any]:
-    """Invoke ``BrowserBot`` methods inside a session-aware, thread-safe section."""
-    bundle = _get_agent_bundle(client_id)
-    with bundle.lock:
-        agent_method = getattr(bundle.bot, method)
-        return agent_method(*args, **kwargs)
+    """Invoke a ``BrowserBot`` method; runs on the session's own thread."""
+    agent_method = getattr(bot, method)
+    return agent_method(*args, **kwargs)
 
 
 async def _run_agent(
@@ -57,23 +87,64 @@ async def _run_agent(
     client_id: Optional[str] = None,
     **kwargs,
 ) -> Dict[str, Any]:
-    return await asyncio.to_thread(
-        _call_with_errors,
-        method,
-        client_id,
-        args,
-        kwargs,
+    """Dispatch to the client's session thread; sessions run concurrently.
+
+    Repeated read-only calls within ``_RESULT_CACHE_TTL_S`` are answered
+    from the session's cache without a thread hop, and an identical call
+    that is still queued or running is awaited instead of run again.
+    """
+    bundle = _get_agent_bundle(client_id)
+    cache_key: Optional[str] = None
+    reads_current_page = not (args and args[0]) and not kwargs.get("url")
+    if method in _CACHEABLE_METHODS and reads_current_page:
+        cache_key = repr((method, args, sorted(kwargs.items())))
+        cached = bundle.results.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        pending = bundle.inflight.get(cache_key)
+        if pending is not None and pending[0] == bundle.generation:
+            return await asyncio.shield(pending[1])
+    else:
+        bundle.generation += 1
+        bundle.results.clear()
+        # Reads queued before this call must not answer reads issued after it.
+        bundle.inflight.clear()
+    generation = bundle.generation
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        bundle.executor,
+        partial(_call_with_errors, bundle.bot, method, args, kwargs),
     )
+    if cache_key is not None:
+        bundle.inflight[cache_key] = (generation, future)
+    try:
+        result = await asyncio.shield(future)
+    finally:
+        entry = bundle.inflight.get(cache_key) if cache_key is not None else None
+        if entry is not None and entry[1] is future:
+            del bundle.inflight[cache_key]
+    if (
+        cache_key is not None
+        and "error" not in result
+        and generation == bundle.generation
+    ):
+        now = time.monotonic()
+        if len(bundle.results) >= _RESULT_CACHE_MAX_ENTRIES:
+            bundle.results = {
+                key: entry for key, entry in bundle.results.items() if entry[0] > now
+            }
+        bundle.results[cache_key] = (now + _RESULT_CACHE_TTL_S, result)
+    return result
 
 
 def _call_with_errors(
+    bot: BrowserBot,
     method: str,
-    client_id: Optional[str],
     args: Sequence[Any],
     kwargs: Dict[str, Any],
 ) -> Dict[str, Any]:
     try:
-        return _call_agent(method, client_id, *args, **kwargs)
+        return _call_agent(bot, method, *args, **kwargs)
     except TimeoutError as exc:
         return {"error": "timeout", "operation": method, "message": str(exc)}
     except Error as exc:
@@ -88,10 +159,9 @@ def _reset_sessions() -> None:
         bundles = list(_session_agents.values())
         _session_agents.clear()
     for bundle in bundles:
-        try:
-            bundle.bot.shutdown()
-        except Exception:
-            pass
+        # Shut the bot down on its own thread; queued calls finish first.
+        bundle.executor.submit(bundle.bot.shutdown)
+        bundle.executor.shutdown(wait=False)
 
 
 def _get_agent_bundle(client_id: Optional[str]) -> _AgentBundle:
@@ -104,7 +174,13 @@ def _get_agent_bundle(client_id: Optional[str]) -> _AgentBundle:
                 headless=_session_config["headless"],
                 persist_context=_session_config["persist_context"],
             )
-            bundle = _AgentBundle(bot=bot, lock=Lock())
+            bundle = _AgentBundle(
+                bot=bot,
+                executor=ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=f"botman-{key}",
+                ),
+            )
             _session_agents[key] = bundle
     return bundle
 
@@ -134,6 +210,7 @@ async def navigate(
     url: str,
     *,
     wait_until: str = "load",
+    include_title: bool = True,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """Navigate to ``url`` and return the final location and title."""
@@ -141,6 +218,7 @@ async def navigate(
         "navigate",
         url,
         wait_until=wait_until,
+        include_title=include_title,
         client_id=_client_id_from_context(ctx),
     )
 
@@ -149,13 +227,19 @@ async def navigate(
 async def list_links(
     url: Optional[str] = None,
     *,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     limit: Optional[int] = 200,
     root_selector: Optional[str] = None,
     link_selector: Optional[str] = None,
+    skip_resources: Optional[Sequence[str]] = None,
+    offset: int = 0,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
-    """List anchor tags found on ``url`` with basic metadata."""
+    """List anchor tags found on ``url`` with basic metadata.
+
+    Use ``offset``/``limit`` to page through large link sets; ``limit=0``
+    returns only the total ``count``.
+    """
     return await _run_agent(
         "list_links",
         url,
@@ -163,6 +247,60 @@ async def list_links(
         limit=limit,
         root_selector=root_selector,
         link_selector=link_selector,
+        skip_resources=skip_resources,
+        offset=offset,
+        client_id=_client_id_from_context(ctx),
+    )
+
+
+@mcp.tool
+async def navigate_many(
+    urls: Sequence[str],
+    *,
+    wait_until: str = "load",
+    max_concurrency: int = 4,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Load several URLs with overlapping page loads; results keep input order.
+
+    At most 32 URLs and a max_concurrency of 8 are accepted.  With the
+    default persist_context mode the pages use pooled stateless contexts,
+    so they do not share this session's cookies.
+    """
+    return await _run_agent(
+        "navigate_many",
+        urls,
+        wait_until=wait_until,
+        max_concurrency=max_concurrency,
+        client_id=_client_id_from_context(ctx),
+    )
+
+
+@mcp.tool
+async def list_links_many(
+    urls: Sequence[str],
+    *,
+    wait_until: str = "domcontentloaded",
+    limit: Optional[int] = 200,
+    root_selector: Optional[str] = None,
+    link_selector: Optional[str] = None,
+    max_concurrency: int = 4,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """List anchor tags for several URLs with overlapping page loads.
+
+    At most 32 URLs and a max_concurrency of 8 are accepted.  With the
+    default persist_context mode the pages use pooled stateless contexts,
+    so they do not share this session's cookies.
+    """
+    return await _run_agent(
+        "list_links_many",
+        urls,
+        wait_until=wait_until,
+        limit=limit,
+        root_selector=root_selector,
+        link_selector=link_selector,
+        max_concurrency=max_concurrency,
         client_id=_client_id_from_context(ctx),
     )
 
@@ -172,8 +310,10 @@ async def extract_text(
     url: Optional[str] = None,
     *,
     selector: str,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     timeout_ms: Optional[int] = None,
+    early: bool = False,
+    skip_resources: Optional[Sequence[str]] = None,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """Extract text for the given CSS selector."""
@@ -183,6 +323,8 @@ async def extract_text(
         selector=selector,
         wait_until=wait_until,
         timeout_ms=timeout_ms,
+        early=early,
+        skip_resources=skip_resources,
         client_id=_client_id_from_context(ctx),
     )
 
@@ -191,10 +333,11 @@ async def extract_text(
 async def extract_html(
     url: Optional[str] = None,
     *,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     selector: Optional[str] = None,
     timeout_ms: Optional[int] = None,
     inner: bool = False,
+    skip_resources: Optional[Sequence[str]] = None,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """Return raw HTML for the page or a specific selector."""
@@ -205,6 +348,7 @@ async def extract_html(
         selector=selector,
         timeout_ms=timeout_ms,
         inner=inner,
+        skip_resources=skip_resources,
         client_id=_client_id_from_context(ctx),
     )
 
@@ -214,9 +358,11 @@ async def click(
     url: Optional[str] = None,
     *,
     selector: str,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     timeout_ms: Optional[int] = None,
-    post_wait: Optional[str] = "networkidle",
+    post_wait: Optional[str] = "domcontentloaded",
+    include_title: bool = True,
+    early: bool = False,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """Click a selector on ``url`` and report the resulting page."""
@@ -227,6 +373,8 @@ async def click(
         wait_until=wait_until,
         timeout_ms=timeout_ms,
         post_wait=post_wait,
+        include_title=include_title,
+        early=early,
         client_id=_client_id_from_context(ctx),
     )
 
@@ -239,6 +387,7 @@ async def fill_fields(
     wait_until: str = "load",
     timeout_ms: Optional[int] = None,
     clear_existing: bool = True,
+    batch: bool = False,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """Populate one or more form fields."""
@@ -249,6 +398,7 @@ async def fill_fields(
         wait_until=wait_until,
         timeout_ms=timeout_ms,
         clear_existing=clear_existing,
+        batch=batch,
         client_id=_client_id_from_context(ctx),
     )
 
@@ -329,7 +479,7 @@ async def wait(
 async def describe_dom(
     url: Optional[str] = None,
     *,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """Return a structural outline of the page."""
@@ -345,7 +495,7 @@ async def describe_dom(
 async def list_forms(
     url: Optional[str] = None,
     *,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     include_values: bool = True,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
@@ -363,7 +513,7 @@ async def list_forms(
 async def list_buttons(
     url: Optional[str] = None,
     *,
-    wait_until: str = "load",
+    wait_until: str = "domcontentloaded",
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
     """List button-like elements present on the page."""
@@ -375,6 +525,26 @@ async def list_buttons(
     )
 
 
+@mcp.tool
+async def list_tables(
+    url: Optional[str] = None,
+    *,
+    wait_until: str = "domcontentloaded",
+    limit: Optional[int] = 20,
+    max_rows: Optional[int] = 50,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Return captions, headers, and cell text for tables on the page."""
+    return await _run_agent(
+        "list_tables",
+        url,
+        wait_until=wait_until,
+        limit=limit,
+        max_rows=max_rows,
+        client_id=_client_id_from_context(ctx),
+    )
+
+
 @mcp.tool
 async def evaluate_js(
     script: str,
@@ -403,9 +573,15 @@ async def take_screenshot(
     full_page: bool = True,
     image_format: str = "png",
     quality: Optional[int] = None,
+    as_data_uri: bool = False,
     ctx: Optional[Context] = None,
 ) -> Dict[str, Any]:
-    """Capture a screenshot of ``url`` (or ``selector``) as base64."""
+    """Capture a screenshot of ``url`` (or ``selector``) as base64.
+
+    ``image_format`` may be ``png``, ``jpeg``, or ``webp``.  Set
+    ``as_data_uri`` to receive a ``data:`` URI ready to embed in HTML or
+    Markdown.
+    """
     return await _run_agent(
         "screenshot",
         url,
@@ -414,13 +590,102 @@ async def take_screenshot(
         full_page=full_page,
         image_format=image_format,
         quality=quality,
+        encode="data_uri" if as_data_uri else "base64",
+        client_id=_client_id_from_context(ctx),
+    )
+
+
+@mcp.tool
+async def take_screenshot_image(
+    url: Optional[str] = None,
+    *,
+    wait_until: str = "load",
+    selector: Optional[str] = None,
+    full_page: bool = True,
+    image_format: str = "png",
+    quality: Optional[int] = None,
+    ctx: Optional[Context] = None,
+) -> Image | Dict[str, Any]:
+    """Capture a screenshot and return it as MCP image content.
+
+    The bot hands back raw bytes, so the image is encoded once by the
+    transport instead of being wrapped in a JSON string field.
+    """
+    result = await _run_agent(
+        "screenshot",
+        url,
+        wait_until=wait_until,
+        selector=selector,
+        full_page=full_page,
+        image_format=image_format,
+        quality=quality,
+        encode="raw",
+        client_id=_client_id_from_context(ctx),
+    )
+    if "error" in result:
+        return result
+    return Image(data=result["screenshot"], format=image_format)
+
+
+@mcp.tool
+async def inspect(
+    url: Optional[str] = None,
+    *,
+    wait_until: str = "load",
+    text_selectors: Optional[Sequence[str]] = None,
+    links: bool = False,
+    link_limit: Optional[int] = 200,
+    screenshot: bool = False,
+    full_page: bool = True,
+    image_format: str = "png",
+    quality: Optional[int] = None,
+    timeout_ms: Optional[int] = None,
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Extract text, links and/or a screenshot from one load of ``url``."""
+    return await _run_agent(
+        "inspect",
+        url,
+        wait_until=wait_until,
+        text_selectors=text_selectors,
+        links=links,
+        link_limit=link_limit,
+        screenshot=screenshot,
+        full_page=full_page,
+        image_format=image_format,
+        quality=quality,
+        timeout_ms=timeout_ms,
+        client_id=_client_id_from_context(ctx),
+    )
+
+
+@mcp.tool
+async def run_batch(
+    steps: Sequence[Dict[str, Any]],
+    ctx: Optional[Context] = None,
+) -> Dict[str, Any]:
+    """Run several tool calls in order as one request.
+
+    Each step is ``{"op": "<tool method>", "args": {...}}``; at most 32 steps
+    run per call and execution stops at the first failing step, whose error
+    is reported with the earlier results.  Screenshot steps cannot set
+    ``output_path``.
+    """
+    return await _run_agent(
+        "run_batch",
+        steps,
         client_id=_client_id_from_context(ctx),
     )
 
 
 def main() -> None:
     """Run the Botman MCP server using the default configuration."""
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        # Close each session's browser on its own thread; the executors'
+        # workers are joined at interpreter exit, so this completes.
+        _reset_sessions()
 
 
 __all__ = [
@@ -428,7 +693,9 @@ __all__ = [
     "configure_browser_agent",
     "ensure_login",
     "navigate",
+    "navigate_many",
     "list_links",
+    "list_links_many",
     "extract_text",
     "extract_html",
     "click",
@@ -439,7 +706,11 @@ __all__ = [
     "describe_dom",
     "list_forms",
     "list_buttons",
+    "list_tables",
     "evaluate_js",
     "take_screenshot",
+    "take_screenshot_image",
+    "inspect",
+    "run_batch",
     "main",
 ]
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import argparse
 
-from botman.browser.core import create_browserbot
-
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -25,6 +23,9 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Imported after parsing so ``--help`` and usage errors skip loading Playwright.
+    from botman.browser.core import create_browserbot
+
     with create_browserbot(headless=False, persist_context=args.persist) as agent:
         result = agent.ensure_login(args.domain, force=args.force)
         print(
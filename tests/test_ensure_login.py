@@ -0,0 +1,204 @@
+"""ensure_login behaviour for cached sessions that outlived ``max_age_s``."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError  # noqa: E402
+
+from botman.browser.auth import DomainConfig  # noqa: E402
+from botman.browser.core import BrowserBot  # noqa: E402
+
+DOMAIN = "example.com"
+
+
+class _FakePage:
+    url = "about:blank"
+
+    def goto(self, url, **_):
+        self.url = url
+
+
+class _FakeContext:
+    def new_page(self):
+        return _FakePage()
+
+    def storage_state(self):
+        return {"cookies": [{"name": "sid", "domain": f".{DOMAIN}"}], "origins": []}
+
+    def close(self):
+        pass
+
+
+class _FakeBrowser:
+    def new_context(self, **_):
+        return _FakeContext()
+
+
+@pytest.fixture
+def stale_config(tmp_path):
+    path = tmp_path / f"{DOMAIN}.json"
+    path.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
+    old = time.time() - 3600
+    os.utime(path, (old, old))
+    return DomainConfig(
+        domain=DOMAIN,
+        login_url=f"https://{DOMAIN}/login",
+        instructions="",
+        storage_state_path=path,
+        max_age_s=60,
+    )
+
+
+def test_stale_session_is_refreshed_headlessly(stale_config, monkeypatch):
+    bot = BrowserBot(domain_configs={DOMAIN: stale_config})
+    monkeypatch.setattr(bot, "_ensure_browser", _FakeBrowser)
+    monkeypatch.setattr(
+        bot, "_run_manual_login", lambda config: pytest.fail("manual login ran")
+    )
+
+    result = bot.ensure_login(DOMAIN)
+
+    assert result["refreshed"] is True
+    assert result["created"] is False
+    saved = json.loads(stale_config.storage_state_path.read_text(encoding="utf-8"))
+    assert [cookie["name"] for cookie in saved["cookies"]] == ["sid"]
+
+
+class _LoggedOutPage(_FakePage):
+    def locator(self, selector):
+        def wait_for(**_):
+            raise PlaywrightTimeoutError(f"{selector} never appeared")
+
+        return SimpleNamespace(first=SimpleNamespace(wait_for=wait_for))
+
+
+class _LoggedOutBrowser:
+    def new_context(self, **_):
+        context = _FakeContext()
+        context.new_page = _LoggedOutPage
+        return context
+
+
+def test_refresh_uses_configured_success_selector(stale_config, monkeypatch):
+    config = replace(stale_config, success_selector="#account-menu")
+    bot = BrowserBot(domain_configs={DOMAIN: config})
+    monkeypatch.setattr(bot, "_ensure_browser", _LoggedOutBrowser)
+    logins = []
+    monkeypatch.setattr(bot, "_run_manual_login", logins.append)
+
+    result = bot.ensure_login(DOMAIN)
+
+    assert result["refreshed"] is False
+    assert logins == [config]
+
+
+def test_user_data_dir_login_needs_headed_profile(stale_config, tmp_path, monkeypatch):
+    bot = BrowserBot(
+        user_data_dir=tmp_path / "profile", domain_configs={DOMAIN: stale_config}
+    )
+    monkeypatch.setattr(
+        bot, "_run_manual_login", lambda config: pytest.fail("separate browser used")
+    )
+
+    with pytest.raises(RuntimeError, match="headless=False"):
+        bot.ensure_login(DOMAIN)
+
+
+def test_user_data_dir_login_runs_in_profile(stale_config, tmp_path, monkeypatch):
+    bot = BrowserBot(
+        headless=False,
+        user_data_dir=tmp_path / "profile",
+        domain_configs={DOMAIN: stale_config},
+    )
+    page = _LoginPage([f"https://{DOMAIN}/inbox"])
+    page.context = _FakeContext()
+    monkeypatch.setattr(bot, "_ensure_user_data_page", lambda: page)
+    monkeypatch.setattr(
+        bot, "_ensure_browser", lambda: pytest.fail("separate context requested")
+    )
+    monkeypatch.setattr(
+        bot, "_run_manual_login", lambda config: pytest.fail("separate browser used")
+    )
+    monkeypatch.setattr(
+        bot,
+        "_invalidate_persistent_context",
+        lambda: pytest.fail("profile context was closed"),
+    )
+
+    result = bot.ensure_login(DOMAIN)
+
+    assert result["created"] is True
+    assert page.url == f"https://{DOMAIN}/inbox"
+    saved = json.loads(stale_config.storage_state_path.read_text(encoding="utf-8"))
+    assert [cookie["name"] for cookie in saved["cookies"]] == ["sid"]
+
+
+class _LoginPage:
+    """Page that walks through ``visits`` as ``wait_for_url`` polls it."""
+
+    def __init__(self, visits):
+        self.url = "about:blank"
+        self._visits = list(visits)
+
+    def goto(self, url, **_):
+        self.url = url
+
+    def wait_for_url(self, predicate, timeout):
+        while not predicate(self.url):
+            if not self._visits:
+                raise PlaywrightTimeoutError("login did not finish")
+            self.url = self._visits.pop(0)
+
+    def wait_for_load_state(self, state):
+        pass
+
+
+class _LoginBrowser:
+    def __init__(self, page):
+        self.page = page
+
+    def new_context(self, **_):
+        context = _FakeContext()
+        context.new_page = lambda: self.page
+        return context
+
+    def close(self):
+        pass
+
+
+class _FakePlaywright:
+    def __init__(self, page):
+        self.chromium = SimpleNamespace(launch=lambda **_: _LoginBrowser(page))
+
+
+def test_manual_login_waits_to_leave_login_page_on_same_domain(
+    stale_config, monkeypatch
+):
+    bot = BrowserBot(domain_configs={DOMAIN: stale_config})
+    page = _LoginPage([f"https://{DOMAIN}/login?step=2", f"https://{DOMAIN}/home"])
+    monkeypatch.setattr(bot, "_playwright", _FakePlaywright(page))
+
+    bot._run_manual_login(stale_config)
+
+    assert page.url == f"https://{DOMAIN}/home"
+
+
+def test_manual_login_times_out_while_still_on_login_page(stale_config, monkeypatch):
+    bot = BrowserBot(domain_configs={DOMAIN: stale_config})
+    page = _LoginPage([])
+    monkeypatch.setattr(bot, "_playwright", _FakePlaywright(page))
+    before = stale_config.storage_state_path.read_text(encoding="utf-8")
+
+    with pytest.raises(PlaywrightTimeoutError):
+        bot._run_manual_login(stale_config)
+
+    assert stale_config.storage_state_path.read_text(encoding="utf-8") == before
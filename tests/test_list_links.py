@@ -0,0 +1,21 @@
+"""list_links argument validation."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from botman.browser.core import BrowserBot  # noqa: E402
+
+
+def test_list_links_rejects_negative_limit():
+    bot = BrowserBot()
+    with pytest.raises(ValueError, match="limit"):
+        bot.list_links("https://example.com/", limit=-1)
+
+
+def test_list_links_many_rejects_negative_limit():
+    bot = BrowserBot()
+    with pytest.raises(ValueError, match="limit"):
+        bot.list_links_many(["https://example.com/"], limit=-1)
@@ -0,0 +1,23 @@
+"""``botman.mcp``/``botman.app`` name the server objects whatever loads first."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("fastmcp")
+pytest.importorskip("playwright.sync_api")
+
+
+@pytest.mark.parametrize("first", ["botman.mcp.server", "botman.app", "botman"])
+def test_package_exports_are_server_objects(first):
+    script = (
+        f"import {first}\n"
+        "import botman\n"
+        "from fastmcp import FastMCP\n"
+        "assert isinstance(botman.mcp, FastMCP), type(botman.mcp)\n"
+        "assert not isinstance(botman.app, type(botman)), type(botman.app)\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,72 @@
+"""Persistent-context reuse around the default storage_state snapshot."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from botman.browser.core import BrowserBot  # noqa: E402
+
+
+class _FakePage:
+    def __init__(self):
+        self.url = "about:blank"
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def goto(self, url, **_):
+        self.url = url
+
+    def wait_for_load_state(self, state):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self):
+        self.page = _FakePage()
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def new_page(self):
+        return self.page
+
+    def storage_state(self, path=None):
+        path.write_text('{"cookies": [], "origins": []}', encoding="utf-8")
+
+    def close(self):
+        self.page.closed = True
+
+
+def test_saved_snapshot_does_not_rebuild_persistent_context(tmp_path, monkeypatch):
+    bot = BrowserBot(persist_context=True, storage_state=tmp_path / "state.json")
+    created = []
+
+    def new_context(**_):
+        created.append(_FakeContext())
+        return created[-1]
+
+    monkeypatch.setattr(bot, "_new_context", new_context)
+
+    with bot._open_page("https://a.example/", wait_until="load") as page:
+        first = page
+    bot.save_storage_state()
+    with bot._open_page(None, wait_until="load") as page:
+        assert page is first
+        assert page.url == "https://a.example/"
+    with bot._open_page("https://b.example/", wait_until="load") as page:
+        assert page is first
+
+    assert len(created) == 1
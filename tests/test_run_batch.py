@@ -0,0 +1,60 @@
+"""run_batch step validation."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from botman.browser.core import BrowserBot  # noqa: E402
+
+
+def test_run_batch_rejects_raw_screenshot_steps():
+    bot = BrowserBot()
+    with pytest.raises(ValueError, match="encode"):
+        bot.run_batch([{"op": "screenshot", "args": {"encode": "raw"}}])
+
+
+def test_run_batch_rejects_output_path_in_screenshot_steps():
+    bot = BrowserBot()
+    with pytest.raises(ValueError, match="output_path"):
+        bot.run_batch([{"op": "screenshot", "args": {"output_path": "/tmp/x.png"}}])
+
+
+def test_run_batch_checks_step_shape_and_kwargs_before_running(monkeypatch):
+    bot = BrowserBot()
+
+    def wait(url=None, *, delay_ms=1000, wait_until="load"):
+        pytest.fail("step ran")
+
+    monkeypatch.setattr(bot, "wait", wait)
+    with pytest.raises(TypeError, match="mapping"):
+        bot.run_batch([{"op": "wait"}, "wait"])
+    with pytest.raises(TypeError, match="invalid args for wait"):
+        bot.run_batch([{"op": "wait"}, {"op": "wait", "args": {"delay": 1}}])
+
+
+def test_run_batch_reports_value_errors_with_earlier_results(monkeypatch):
+    bot = BrowserBot()
+    calls = []
+
+    def wait(url=None, *, delay_ms=1000, wait_until="load"):
+        calls.append(wait_until)
+        if wait_until == "bogus":
+            raise ValueError("wait_until must be one of {...}.")
+        return {"waited_ms": delay_ms}
+
+    monkeypatch.setattr(bot, "wait", wait)
+    result = bot.run_batch(
+        [
+            {"op": "wait", "args": {"delay_ms": 0}},
+            {"op": "wait", "args": {"wait_until": "bogus"}},
+            {"op": "wait"},
+        ]
+    )
+
+    assert result["completed"] is False
+    assert result["count"] == 2
+    assert result["results"][0] == {"op": "wait", "waited_ms": 0}
+    assert result["results"][1]["error"] == "invalid"
+    assert calls == ["load", "bogus"]
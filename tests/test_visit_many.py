@@ -0,0 +1,77 @@
+"""navigate_many on a persistent-profile bot."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("playwright.sync_api")
+
+from botman.browser.core import MAX_BATCH_URLS, MAX_CONCURRENCY, BrowserBot  # noqa: E402
+
+
+class _FakeTab:
+    def __init__(self, opened):
+        self.url = "about:blank"
+        self.closed = False
+        opened.append(self)
+
+    def goto(self, url, **_):
+        self.url = url
+
+    def wait_for_load_state(self, state):
+        pass
+
+    def title(self):
+        return f"title of {self.url}"
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeProfile:
+    def __init__(self):
+        self.opened = []
+
+    def new_page(self):
+        return _FakeTab(self.opened)
+
+
+class _FakeProfilePage:
+    def __init__(self):
+        self.context = _FakeProfile()
+
+
+def test_navigate_many_with_user_data_dir_uses_profile_tabs(tmp_path, monkeypatch):
+    bot = BrowserBot(user_data_dir=tmp_path / "profile")
+    profile_page = _FakeProfilePage()
+    monkeypatch.setattr(bot, "_ensure_user_data_page", lambda: profile_page)
+    monkeypatch.setattr(
+        bot, "_ensure_browser", lambda: pytest.fail("separate contexts were requested")
+    )
+
+    urls = ["https://a.example/", "https://b.example/", "https://c.example/"]
+    result = bot.navigate_many(urls, max_concurrency=2)
+
+    assert [entry["url"] for entry in result["results"]] == urls
+    assert [entry["final_url"] for entry in result["results"]] == urls
+    opened = profile_page.context.opened
+    assert len(opened) == 3
+    assert all(tab.closed for tab in opened)
+
+
+@pytest.mark.parametrize(
+    "urls, max_concurrency",
+    [
+        ([f"https://{i}.example/" for i in range(MAX_BATCH_URLS + 1)], 4),
+        (["https://a.example/"], MAX_CONCURRENCY + 1),
+        (["https://a.example/"], 0),
+    ],
+)
+def test_navigate_many_rejects_oversized_batches(urls, max_concurrency, monkeypatch):
+    bot = BrowserBot()
+    monkeypatch.setattr(
+        bot, "_acquire_context", lambda storage_state: pytest.fail("page opened")
+    )
+
+    with pytest.raises(ValueError):
+        bot.navigate_many(urls, max_concurrency=max_concurrency)